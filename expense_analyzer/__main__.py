@@ -0,0 +1,129 @@
+"""Command line entry point for the expense analyzer
+
+Each subcommand imports only the modules it needs, so light commands skip
+the cold-start cost of the report generators, pdf readers, and service
+stack they never touch. Run as `python -m expense_analyzer <command>`.
+"""
+
+import argparse
+from datetime import datetime
+
+
+def _setup_environment():
+    """Load the .env file and configure logging"""
+    from dotenv import load_dotenv
+
+    from expense_analyzer.utils.logging_config import configure_logging
+
+    load_dotenv()
+    configure_logging()
+
+
+def _cmd_process(args):
+    """Process all documents in the input directory"""
+    from expense_analyzer.expense_analyzer import ExpenseAnalyzer
+    from expense_analyzer.report_generators.markdown_generator import (
+        MarkdownExpenseReportGenerator,
+    )
+
+    analyzer = ExpenseAnalyzer(
+        input_dir=args.input_dir, output_dir=args.output_dir, report_generator=MarkdownExpenseReportGenerator()
+    )
+    result = analyzer.process_all_documents()
+    print(result)
+
+
+def _cmd_report(args):
+    """Generate the expense reports for a year"""
+    from expense_analyzer.expense_analyzer import ExpenseAnalyzer
+    from expense_analyzer.report_generators.markdown_generator import (
+        MarkdownExpenseReportGenerator,
+    )
+
+    analyzer = ExpenseAnalyzer(
+        input_dir=args.input_dir, output_dir=args.output_dir, report_generator=MarkdownExpenseReportGenerator()
+    )
+    analyzer.generate_reports(args.year, verbose=args.verbose, generate_transaction_report=args.transactions)
+
+
+def _cmd_categorize(args):
+    """Categorize all transactions without a category"""
+    from expense_analyzer.expense_analyzer import ExpenseAnalyzer
+    from expense_analyzer.report_generators.markdown_generator import (
+        MarkdownExpenseReportGenerator,
+    )
+
+    analyzer = ExpenseAnalyzer(
+        input_dir=args.input_dir, output_dir=args.output_dir, report_generator=MarkdownExpenseReportGenerator()
+    )
+    analyzer.categorize_transactions_without_category()
+
+
+def _cmd_similar(args):
+    """Find transactions similar to a given transaction"""
+    from expense_analyzer.services.expense_service import ExpenseService
+
+    with ExpenseService() as expense_service:
+        transaction = expense_service.transaction_category_repository.get_transaction(args.transaction_id)
+        if transaction is None:
+            print(f"Transaction {args.transaction_id} not found")
+            return
+        for similar in expense_service.find_similar_transactions(transaction, limit=args.limit):
+            print(similar)
+
+
+def _cmd_by_date(args):
+    """Stream transactions within a date range"""
+    from expense_analyzer.services.expense_service import ExpenseService
+
+    start_date = datetime.strptime(args.start, "%Y-%m-%d")
+    end_date = datetime.strptime(args.end, "%Y-%m-%d")
+    count = 0
+    with ExpenseService() as expense_service:
+        for transaction in expense_service.get_transactions_by_date_range_iter(start_date, end_date):
+            print(transaction)
+            count += 1
+    print(f"Found {count} transactions")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with one subcommand per workflow"""
+    parser = argparse.ArgumentParser(prog="expense_analyzer", description="Analyze and report on expenses")
+    parser.add_argument("--input-dir", default="input", help="Directory containing input financial documents")
+    parser.add_argument("--output-dir", default="output", help="Directory where analysis results are saved")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    process_parser = subparsers.add_parser("process", help="Process all documents in the input directory")
+    process_parser.set_defaults(handler=_cmd_process)
+
+    report_parser = subparsers.add_parser("report", help="Generate the expense reports for a year")
+    report_parser.add_argument("year", type=int)
+    report_parser.add_argument("--verbose", action="store_true")
+    report_parser.add_argument("--transactions", action="store_true", help="Also generate the transaction table")
+    report_parser.set_defaults(handler=_cmd_report)
+
+    categorize_parser = subparsers.add_parser("categorize", help="Categorize transactions without a category")
+    categorize_parser.set_defaults(handler=_cmd_categorize)
+
+    similar_parser = subparsers.add_parser("similar", help="Find transactions similar to a transaction")
+    similar_parser.add_argument("transaction_id", type=int)
+    similar_parser.add_argument("--limit", type=int, default=5)
+    similar_parser.set_defaults(handler=_cmd_similar)
+
+    by_date_parser = subparsers.add_parser("by-date", help="List transactions within a date range")
+    by_date_parser.add_argument("start", help="Start date (YYYY-MM-DD)")
+    by_date_parser.add_argument("end", help="End date (YYYY-MM-DD)")
+    by_date_parser.set_defaults(handler=_cmd_by_date)
+
+    return parser
+
+
+def main():
+    """Parse arguments and dispatch to the selected subcommand"""
+    args = _build_parser().parse_args()
+    _setup_environment()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""add ivfflat index on transaction embeddings
+
+Revision ID: a41c7d2e8b53
+Revises: 6803246fc989
+Create Date: 2025-09-01 10:12:33.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a41c7d2e8b53"
+down_revision: Union[str, None] = "6803246fc989"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # IVF (inverted file) index so similarity queries probe a few k-means
+    # partitions instead of scanning every embedding in the table
+    op.create_index(
+        "ix_transactions_embedding_ivfflat",
+        "transactions",
+        ["embedding"],
+        postgresql_using="ivfflat",
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+        postgresql_with={"lists": 100},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_transactions_embedding_ivfflat", table_name="transactions")
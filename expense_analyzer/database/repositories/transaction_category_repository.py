@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 import numpy as np
 from sqlalchemy import extract, func
@@ -45,16 +45,41 @@ class TransactionCategoryRepository:
         )
         return transactions
 
-    def get_transactions_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Transaction]:
-        """Get all transactions within a date range"""
+    def get_transactions_by_date_range(
+        self, start_date: datetime, end_date: datetime, require_category: bool = False
+    ) -> List[Transaction]:
+        """Get all transactions within a date range
+
+        When require_category is True the category predicate runs in SQL, so
+        uncategorized rows are never pulled over the wire just to be discarded
+        in Python."""
         self.logger.debug(f"Getting all transactions between {start_date} and {end_date}")
-        transactions = (
+        criteria = [Transaction.date >= start_date, Transaction.date <= end_date]
+        if require_category:
+            criteria.append(Transaction.category_id.is_not(None))
+        transactions = self.db.query(Transaction).options(joinedload(Transaction.category)).filter(*criteria).all()
+        return transactions
+
+    def get_transactions_by_date_range_iter(
+        self, start_date: datetime, end_date: datetime, batch_size: int = 1000, require_category: bool = False
+    ) -> Iterator[Transaction]:
+        """Stream transactions within a date range
+
+        Uses a server-side cursor with yield_per so rows flow through in
+        batches of batch_size instead of materializing the full result set."""
+        self.logger.debug(f"Streaming transactions between {start_date} and {end_date}")
+        criteria = [Transaction.date >= start_date, Transaction.date <= end_date]
+        if require_category:
+            criteria.append(Transaction.category_id.is_not(None))
+        query = (
             self.db.query(Transaction)
             .options(joinedload(Transaction.category))
-            .filter(Transaction.date >= start_date, Transaction.date <= end_date)
-            .all()
+            .filter(*criteria)
+            .execution_options(stream_results=True)
+            .yield_per(batch_size)
         )
-        return transactions
+        for transaction in query:
+            yield transaction
 
     def get_transactions_by_category(self, category_id: int) -> List[Transaction]:
         """Get all transactions with a specific category"""
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from expense_analyzer.database.models import Transaction
 
@@ -73,8 +73,13 @@ class TransactionRepository:
     def get_transactions_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Transaction]:
         """Get transactions within a date range"""
         self.logger.debug(f"Getting transactions between {start_date} and {end_date}")
+        # Eager-load categories in one secondary SELECT so iterating the
+        # results does not fire a lazy-load query per row
         transactions = (
-            self.db.query(Transaction).filter(Transaction.date >= start_date, Transaction.date <= end_date).all()
+            self.db.query(Transaction)
+            .options(selectinload(Transaction.category))
+            .filter(Transaction.date >= start_date, Transaction.date <= end_date)
+            .all()
         )
         self.logger.debug(f"Retrieved {len(transactions)} transactions in date range")
         return transactions
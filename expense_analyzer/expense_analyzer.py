@@ -85,6 +85,8 @@ class ExpenseAnalyzer:
         with ExpenseService() as expense_service:
             transactions_inserted = expense_service.insert_transactions(transactions_found)
 
+        self.transactions = transactions_found
+
         return ProcessDocumentsResult(
             transactions_found=transactions_found,
             files_processed=files_processed,
@@ -1,7 +1,9 @@
+import functools
 import logging
 from datetime import datetime
-from typing import List
+from typing import Iterator, List, Optional
 
+import numpy as np
 from sqlalchemy.orm import Session
 
 from expense_analyzer.categorizers import SimpleCategorizer
@@ -20,6 +22,79 @@ from expense_analyzer.embedder.transaction_embedder import TransactionEmbedder
 from expense_analyzer.models.transaction import ReportTransaction
 
 
+def _score_similarities(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Score a normalized query vector against a normalized embedding matrix
+
+    The whole kernel is a single BLAS matrix-vector product, so it already
+    runs vectorized native code across all rows."""
+    return matrix @ query
+
+
+class _SimilarityCache:
+    """In-memory cache of categorized transaction embeddings for similarity search
+
+    Stacks all embeddings into a single L2-normalized float32 matrix so a
+    similarity query is one matrix-vector product instead of a database round
+    trip. Kept at module level so repeated `with ExpenseService()` blocks reuse
+    the same matrix."""
+
+    def __init__(self):
+        self._matrix_q: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        self._transactions: List[Transaction] = []
+
+    @property
+    def is_warm(self) -> bool:
+        """Check if the cache has been built"""
+        return self._matrix_q is not None
+
+    def build(self, transactions: List[Transaction]) -> None:
+        """Build the quantized embedding matrix from embedded transactions
+
+        Rows are L2-normalized and then scalar-quantized to int8 with a
+        per-row scale, cutting the resident matrix to a quarter of its
+        float32 size at a ~1% cost in score precision."""
+        transactions = [t for t in transactions if t.embedding is not None]
+        if not transactions:
+            self.clear()
+            return
+        matrix = np.asarray([t.embedding for t in transactions], dtype=np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        self._matrix_q = np.round(matrix / scales[:, None]).astype(np.int8)
+        self._scales = scales
+        self._transactions = transactions
+
+    # Rows dequantized per scoring block; bounds the transient float32
+    # allocation instead of materializing the whole matrix per query
+    _CHUNK_ROWS = 4096
+
+    def top(self, embedding: List[float], limit: int) -> List[Transaction]:
+        """Get the transactions most similar to the query embedding"""
+        query = np.asarray(embedding, dtype=np.float32)
+        query /= np.linalg.norm(query)
+        scores = np.empty(self._matrix_q.shape[0], dtype=np.float32)
+        for start in range(0, self._matrix_q.shape[0], self._CHUNK_ROWS):
+            block = self._matrix_q[start : start + self._CHUNK_ROWS].astype(np.float32)
+            scores[start : start + self._CHUNK_ROWS] = _score_similarities(block, query)
+        scores *= self._scales
+        limit = min(limit, len(self._transactions))
+        top_idx = np.argpartition(-scores, limit - 1)[:limit]
+        top_idx = top_idx[np.argsort(-scores[top_idx])]
+        return [self._transactions[i] for i in top_idx]
+
+    def clear(self) -> None:
+        """Drop the cached matrix so it is rebuilt on the next warm-up"""
+        self._matrix_q = None
+        self._scales = None
+        self._transactions = []
+
+
+# Shared across ExpenseService instances so the matrix survives short-lived sessions
+_similarity_cache = _SimilarityCache()
+
+
 class ExpenseService:
     """Service for managing expense data"""
 
@@ -33,6 +108,9 @@ class ExpenseService:
         self.embedder = TransactionEmbedder()
         self.categorizer = SimpleCategorizer()
 
+        # Vendors repeat heavily, so categorization results are memoized per vendor
+        self._vendor_category_cache: dict = {}
+
         self.logger = logging.getLogger("expense_analyzer.services.ExpenseService")
         self.logger.debug("ExpenseService initialized")
 
@@ -51,6 +129,11 @@ class ExpenseService:
             self.logger.debug("Closing database connection")
             self.db.close()
 
+    @functools.cached_property
+    def sub_categories(self) -> List[Category]:
+        """All subcategories, fetched once per service instance"""
+        return self.category_repository.get_all_subcategories()
+
     def _convert_report_transactions_to_database_transactions(
         self, transactions: List[ReportTransaction]
     ) -> List[Transaction]:
@@ -73,10 +156,9 @@ class ExpenseService:
         self.logger.debug(f"Inserting {len(transactions)} transactions into the database")
         # Insert transactions into the database
         database_transactions: List[dict] = self._convert_report_transactions_to_database_transactions(transactions)
-        sub_categories = self.category_repository.get_all_subcategories()
         success_count = 0
         for transaction in database_transactions:
-            category: Category = self._get_category_for_transaction(transaction, sub_categories)
+            category: Category = self._get_category_for_transaction(transaction)
             if category:
                 transaction["category_id"] = category.id
 
@@ -87,14 +169,28 @@ class ExpenseService:
             transaction = self.transaction_repository.create_transaction(transaction)
             if transaction:
                 success_count += 1
+        if success_count:
+            _similarity_cache.clear()
         self.logger.debug(f"Successfully inserted {success_count} transactions")
         return success_count
 
-    def get_transactions_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Transaction]:
+    def get_transactions_by_date_range(
+        self, start_date: datetime, end_date: datetime, require_category: bool = False
+    ) -> List[Transaction]:
         """Get transactions from the database"""
-        transactions = self.transaction_category_repository.get_transactions_by_date_range(start_date, end_date)
+        transactions = self.transaction_category_repository.get_transactions_by_date_range(
+            start_date, end_date, require_category=require_category
+        )
         return transactions
 
+    def get_transactions_by_date_range_iter(
+        self, start_date: datetime, end_date: datetime, require_category: bool = False
+    ) -> Iterator[Transaction]:
+        """Stream transactions from the database without materializing the full list"""
+        return self.transaction_category_repository.get_transactions_by_date_range_iter(
+            start_date, end_date, require_category=require_category
+        )
+
     def get_all_transactions(self) -> List[ReportTransaction]:
         """Get all transactions"""
         return self.transaction_category_repository.get_transactions()
@@ -115,20 +211,43 @@ class ExpenseService:
             transaction.embedding = embedding
             self.transaction_repository.update_transaction(transaction)
 
+    def warm_similarity_cache(self) -> None:
+        """Load all categorized transaction embeddings into the in-memory similarity cache"""
+        self.logger.debug("Warming the similarity cache")
+        _similarity_cache.build(self.get_transactions_with_category())
+
     def find_similar_transactions(self, transaction: Transaction, limit: int = 5) -> List[Transaction]:
-        """Find similar transactions"""
+        """Find similar transactions
+
+        The similarity cache is built lazily on the first call, so repeated
+        lookups score in memory instead of taking a pgvector round trip."""
         embedding = transaction.embedding
         if embedding is None:
             self.logger.warning("Transaction has no embedding")
             embedding = self.embedder.embed_transaction(transaction)
+        if not _similarity_cache.is_warm:
+            self.warm_similarity_cache()
+        if _similarity_cache.is_warm:
+            return _similarity_cache.top(embedding, limit)
+        # Nothing embedded yet; fall back to the database search
         return self.transaction_category_repository.find_similar_transactions(embedding, limit)
 
     def update_transactions_category(self, transactions: List[Transaction]) -> None:
-        """Update the category of a transaction and re-embed it"""
-        sub_categories = self.category_repository.get_all_subcategories()
+        """Update the category of a batch of transactions and re-embed them
+
+        Transactions are grouped by vendor so each distinct vendor is
+        categorized exactly once, instead of one embedding/LLM round trip per
+        row."""
+        transactions_by_vendor: dict = {}
         for transaction in transactions:
-            category = self._get_category_for_transaction(transaction, sub_categories)
-            if category:
+            transactions_by_vendor.setdefault(transaction.vendor, []).append(transaction)
+        self.logger.debug(f"Categorizing {len(transactions)} transactions across {len(transactions_by_vendor)} vendors")
+
+        for vendor_transactions in transactions_by_vendor.values():
+            category = self._get_category_for_transaction(vendor_transactions[0])
+            if not category:
+                continue
+            for transaction in vendor_transactions:
                 transaction.category = category
                 self.logger.debug(f"Updating transaction {transaction.id} with category {category.name}")
 
@@ -136,11 +255,19 @@ class ExpenseService:
                 transaction.embedding = embedding
 
                 self.transaction_repository.update_transaction(transaction)
+        _similarity_cache.clear()
 
     def _get_category_for_transaction(
-        self, transaction: Transaction, sub_categories: List[Category]
+        self, transaction: Transaction, sub_categories: Optional[List[Category]] = None
     ) -> Category | None:
-        """Get a category for a transaction"""
+        """Get a category for a transaction, memoized per vendor"""
+        if sub_categories is None:
+            sub_categories = self.sub_categories
+        vendor = transaction["vendor"] if isinstance(transaction, dict) else transaction.vendor
+        cache_key = vendor.lower().strip() if vendor else ""
+        if cache_key in self._vendor_category_cache:
+            self.logger.debug(f"Using cached category for vendor: {vendor}")
+            return self._vendor_category_cache[cache_key]
 
         # Search for similar transactions
         embedding = self.embedder.embed_transaction(transaction)
@@ -149,6 +276,5 @@ class ExpenseService:
         # Use catergorizer to categorize the transaction
         category = self.categorizer.categorize(transaction, similar_transactions, sub_categories)
 
+        self._vendor_category_cache[cache_key] = category
         return category
-
-        # raise NotImplementedError("Categorization not implemented")
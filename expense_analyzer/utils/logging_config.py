@@ -7,6 +7,11 @@ from logging.config import dictConfig
 
 def configure_logging():
     """Configure logging based on environment variables"""
+    # Already configured (e.g. re-imported under test or called twice);
+    # reconfiguring would stack duplicate handlers
+    if logging.getLogger("expense_analyzer").handlers:
+        return
+
     # Get log level from environment variable, default to INFO
     log_level_name = os.environ.get("LOG_LEVEL", "INFO").upper()
 
@@ -1,5 +1,7 @@
 """Main entry point for the expense analyzer"""
 
+import os
+import sys
 from datetime import datetime
 from pprint import pprint
 
@@ -14,16 +16,31 @@ from expense_analyzer.services.expense_service import ExpenseService
 from expense_analyzer.services.report_service import ReportService
 from expense_analyzer.utils.logging_config import configure_logging
 
-load_dotenv()
+# Skip re-parsing .env when the environment is already populated
+if not os.environ.get("EXPENSE_ANALYZER_ENV_LOADED"):
+    load_dotenv()
+    os.environ["EXPENSE_ANALYZER_ENV_LOADED"] = "1"
 configure_logging()
 
 
+# Precompiled row template; the <40.40 spec pads and truncates the vendor in
+# one step, replacing the per-row slice allocation
+_FORMAT_ROW = "{date} | {vendor:<40.40} | ${amount:>7.2f} | {category}".format
+
+
+def format_transaction(transaction: Transaction) -> str:
+    """Format a transaction as a report row"""
+    return _FORMAT_ROW(
+        date=transaction.date,
+        vendor=transaction.vendor,
+        amount=transaction.absolute_amount,
+        category=transaction.category.name if transaction.category else "Uncategorized",
+    )
+
+
 def print_transaction(transaction: Transaction):
     """Print a transaction"""
-    space = 40
-    print(
-        f"{transaction.date} | {transaction.vendor[:space]:<{space}} | ${transaction.absolute_amount:>7.2f} | {transaction.category.name if transaction.category else 'Uncategorized'}"
-    )
+    print(format_transaction(transaction))
 
 
 def similar_transaction(transaction_id: int):
@@ -38,18 +55,22 @@ def similar_transaction(transaction_id: int):
     print_transaction(transaction)
     print()
     print("Similar transactions:")
-    for transaction in similar_transactions:
-        print_transaction(transaction)
+    sys.stdout.write("\n".join(format_transaction(t) for t in similar_transactions) + "\n")
 
 
-def use_service_to_get_transactions(start_date: datetime, end_date: datetime):
-    """Use the ExpenseService to get transactions by date range"""
-    results = []
+def use_service_to_get_transactions(start_date: datetime, end_date: datetime, require_category: bool = False):
+    """Use the ExpenseService to stream transactions by date range"""
+    lines = []
     with ExpenseService() as expense_service:
-        results = expense_service.get_transactions_by_date_range(start_date, end_date)
-    print(f"Found {len(results)} transactions")
-    for result in results:
-        print_transaction(result)
+        # Category filtering happens in SQL, so excluded rows never reach the client
+        results = expense_service.get_transactions_by_date_range_iter(
+            start_date, end_date, require_category=require_category
+        )
+        for result in results:
+            lines.append(format_transaction(result))
+    # One buffered write instead of one syscall per row
+    sys.stdout.write("\n".join(lines) + "\n")
+    print(f"Found {len(lines)} transactions")
 
 
 def categorize_transactions(transaction_id: int):
@@ -77,8 +98,6 @@ def test_report_service():
 
 def main():
     """Main entry point for the expense analyzer"""
-    # Configure logging    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-
     # Example usage
     analyzer = ExpenseAnalyzer(
         input_dir="input", output_dir="output", report_generator=MarkdownExpenseReportGenerator()
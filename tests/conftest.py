@@ -0,0 +1,13 @@
+"""Suite-wide fixtures."""
+
+import pytest
+from sqlalchemy.orm import configure_mappers
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _configure_mappers():
+    """Compile all ORM mappings once up front.
+
+    Mapper configuration is deferred until the first Transaction or Category
+    is instantiated; paying that cost here keeps it out of individual tests."""
+    configure_mappers()
@@ -0,0 +1,75 @@
+"""Shared database fixtures: an in-memory SQLite engine and rolled-back sessions."""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from expense_analyzer.database.connection import Base
+
+
+@pytest.fixture(scope="session")
+def engine(worker_id):
+    """In-memory SQLite engine with the schema created once per test session.
+
+    Safe under ``pytest -n auto``: each pytest-xdist worker is its own
+    process, so the in-memory database (and the create_all below) is
+    already worker-local and no per-worker file URL is needed. worker_id
+    is "master" for plain runs and "gwN" for parallel ones."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+    # pysqlite's default transaction handling does not cooperate with
+    # SAVEPOINTs; take over BEGIN emission so nested transactions work
+    @event.listens_for(engine, "connect")
+    def _do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine):
+    """Real session wrapped in an outer transaction rolled back after each test.
+
+    The session joins the external transaction through a SAVEPOINT, so
+    repository code can commit freely while the test's writes never outlive
+    the test."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+class SqlCounter:
+    """Counts statements executed on the engine while the fixture is active."""
+
+    def __init__(self):
+        self.count = 0
+
+    def reset(self):
+        self.count = 0
+
+
+@pytest.fixture
+def sql_counter(engine):
+    """Statement counter for asserting how many round trips a call makes.
+
+    Guards against accidental N+1 patterns: a repository method should issue
+    a constant number of statements no matter how many rows come back."""
+    counter = SqlCounter()
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        counter.count += 1
+
+    event.listen(engine, "before_cursor_execute", _count)
+    yield counter
+    event.remove(engine, "before_cursor_execute", _count)
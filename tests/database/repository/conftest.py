@@ -0,0 +1,103 @@
+"""Shared fixtures for the repository unit tests."""
+
+from types import SimpleNamespace
+from unittest.mock import create_autospec
+
+import pytest
+from sqlalchemy.orm import Session
+
+from expense_analyzer.database.repositories.category_repository import (
+    CategoryRepository,
+)
+from expense_analyzer.database.repositories.transaction_category_repository import (
+    TransactionCategoryRepository,
+)
+from expense_analyzer.database.repositories.transaction_repository import (
+    TransactionRepository,
+)
+
+# Autospec'd Session built once at import; create_autospec walks the 80+
+# public Session methods a single time, and tests share the instance
+# rather than re-introspecting the class per test
+_SESSION_TEMPLATE = create_autospec(Session, instance=True, spec_set=True)
+
+
+def _stub_tx(i):
+    """Cheap Transaction stand-in; tests only compare identity and a few fields."""
+    return SimpleNamespace(id=i, vendor="", amount=0.0)
+
+
+# Pre-allocated sentinel transactions shared by both repository test modules;
+# SimpleNamespace skips the spec walk a MagicMock(spec=Transaction) would do
+_TX_POOL = tuple(_stub_tx(i) for i in range(32))
+
+
+def fake_tx_list(n):
+    """Return n shared sentinel transactions as a fresh list."""
+    return list(_TX_POOL[:n])
+
+
+class FakeQuery(list):
+    """Minimal Query stand-in preloaded with its result rows.
+
+    Builder methods return self so arbitrarily deep call chains collapse to
+    one object, replacing a dozen auto-created MagicMock children per test;
+    the arguments that matter are recorded for assertions."""
+
+    def options(self, *args, **kwargs):
+        return self
+
+    def filter(self, *args, **kwargs):
+        return self
+
+    def where(self, *args, **kwargs):
+        return self
+
+    def order_by(self, *args, **kwargs):
+        return self
+
+    def group_by(self, *args, **kwargs):
+        return self
+
+    def limit(self, n):
+        self.limit_arg = n
+        return self
+
+    def execution_options(self, **kwargs):
+        self.execution_options_kwargs = kwargs
+        return self
+
+    def yield_per(self, n):
+        self.yield_per_arg = n
+        return iter(self)
+
+    def all(self):
+        return list(self)
+
+    def first(self):
+        return self[0] if self else None
+
+
+@pytest.fixture
+def mock_db():
+    """The shared session mock, reset to a clean state for each test."""
+    _SESSION_TEMPLATE.reset_mock(return_value=True, side_effect=True)
+    return _SESSION_TEMPLATE
+
+
+@pytest.fixture
+def category_repo(mock_db):
+    """CategoryRepository bound to the shared session mock."""
+    return CategoryRepository(mock_db)
+
+
+@pytest.fixture
+def transaction_category_repo(mock_db):
+    """TransactionCategoryRepository bound to the shared session mock."""
+    return TransactionCategoryRepository(mock_db)
+
+
+@pytest.fixture
+def transaction_repo(db_session):
+    """TransactionRepository bound to the SQLite-backed session."""
+    return TransactionRepository(db_session)
@@ -1,585 +1,307 @@
 """Unit tests for the TransactionCategoryRepository class."""
 
-import logging
-import unittest
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
-import numpy as np
-from sqlalchemy import extract, func
+import pytest
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
 
-from expense_analyzer.database.models import Category, Transaction, VendorSummary
+from expense_analyzer.database.models import Transaction, VendorSummary
 from expense_analyzer.database.repositories.transaction_category_repository import (
     TransactionCategoryRepository,
 )
+from tests.database.repository.conftest import FakeQuery, fake_tx_list
 
+# Full dotted logger name asserted by both logger tests; a single constant
+# keeps one literal and lets the comparison short-circuit on identity
+_LOGGER_NAME = "expense_analyzer.database.repositories.transaction_category_repository.TransactionCategoryRepository"
 
-class TestTransactionCategoryRepository(unittest.TestCase):
-    """Test cases for the TransactionCategoryRepository class."""
-
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.mock_db = MagicMock(spec=Session)
-        self.repo = TransactionCategoryRepository(self.mock_db)
-
-    def test_init_creates_logger(self):
-        """Test that logger is created during initialization."""
-        # Act
-        repo = TransactionCategoryRepository(self.mock_db)
-
-        # Assert
-        self.assertIsNotNone(repo.logger)
-        self.assertEqual(
-            repo.logger.name,
-            "expense_analyzer.database.repositories.transaction_category_repository.TransactionCategoryRepository",
-        )
-
-    @patch("logging.getLogger")
-    def test_logger_debug_called(self, mock_get_logger):
-        """Test that logger.debug is called during initialization."""
-        # Arrange
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
-        # Act
-        repo = TransactionCategoryRepository(self.mock_db)
-
-        # Assert
-        mock_get_logger.assert_called_once_with(
-            "expense_analyzer.database.repositories.transaction_category_repository.TransactionCategoryRepository"
-        )
-        mock_logger.debug.assert_called_once_with("TransactionCategoryRepository initialized")
-
-    def test_get_transactions(self):
-        """Test retrieving all transactions with categories."""
-        # Arrange
-        mock_transactions = [MagicMock(spec=Transaction) for _ in range(3)]
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        options_mock.all.return_value = mock_transactions
-
-        # Act
-        result = self.repo.get_transactions()
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        query_mock.options.assert_called_once()
-        options_mock.all.assert_called_once()
-        self.assertEqual(result, mock_transactions)
-
-    def test_get_transactions_empty_result(self):
-        """Test retrieving all transactions with categories when no transactions exist."""
-        # Arrange
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        options_mock.all.return_value = []
-
-        # Act
-        result = self.repo.get_transactions()
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        query_mock.options.assert_called_once()
-        options_mock.all.assert_called_once()
-        self.assertEqual(result, [])
-        self.assertEqual(len(result), 0)
-
-    def test_get_transactions_handles_exception(self):
-        """Test that get_transactions handles exceptions gracefully."""
-        # Arrange
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        options_mock.all.side_effect = SQLAlchemyError("Database error")
-
-        # Act/Assert
-        with self.assertRaises(SQLAlchemyError):
-            self.repo.get_transactions()
-
-    def test_get_transaction(self):
-        """Test retrieving a transaction by ID."""
-        # Arrange
-        transaction_id = 1
-        mock_transaction = MagicMock(spec=Transaction)
-        mock_transaction.id = transaction_id
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        filter_mock = options_mock.filter.return_value
-        filter_mock.first.return_value = mock_transaction
-
-        # Act
-        result = self.repo.get_transaction(transaction_id)
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        query_mock.options.assert_called_once()
-        options_mock.filter.assert_called_once()
-        filter_mock.first.assert_called_once()
-        self.assertEqual(result, mock_transaction)
-
-    def test_get_transaction_not_found(self):
-        """Test retrieving a non-existent transaction by ID."""
-        # Arrange
-        transaction_id = 999
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        filter_mock = options_mock.filter.return_value
-        filter_mock.first.return_value = None
-
-        # Act
-        result = self.repo.get_transaction(transaction_id)
-
-        # Assert
-        self.assertIsNone(result)
-
-    def test_get_transactions_with_category(self):
-        """Test retrieving all transactions that have a category assigned."""
-        # Arrange
-        mock_transactions = [MagicMock(spec=Transaction) for _ in range(2)]
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        filter_mock = options_mock.filter.return_value
-        filter_mock.all.return_value = mock_transactions
-
-        # Act
-        result = self.repo.get_transactions_with_category()
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        query_mock.options.assert_called_once()
-        options_mock.filter.assert_called_once()
-        filter_mock.all.assert_called_once()
-        self.assertEqual(result, mock_transactions)
-
-    def test_get_transactions_with_category_empty_result(self):
-        """Test retrieving transactions with categories when none have categories."""
-        # Arrange
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        filter_mock = options_mock.filter.return_value
-        filter_mock.all.return_value = []
-
-        # Act
-        result = self.repo.get_transactions_with_category()
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        query_mock.options.assert_called_once()
-        options_mock.filter.assert_called_once()
-        filter_mock.all.assert_called_once()
-        self.assertEqual(result, [])
-        self.assertEqual(len(result), 0)
-
-    def test_get_transactions_by_date_range(self):
-        """Test retrieving transactions within a date range."""
-        # Arrange
-        start_date = datetime(2023, 1, 1)
-        end_date = datetime(2023, 12, 31)
-        mock_transactions = [MagicMock(spec=Transaction) for _ in range(5)]
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        filter_mock = options_mock.filter.return_value
-        filter_mock.all.return_value = mock_transactions
-
-        # Act
-        result = self.repo.get_transactions_by_date_range(start_date, end_date)
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        query_mock.options.assert_called_once()
-        options_mock.filter.assert_called_once()
-        filter_mock.all.assert_called_once()
-        self.assertEqual(result, mock_transactions)
-
-    def test_get_transactions_by_date_range_invalid_dates(self):
-        """Test retrieving transactions with start date after end date."""
-        # Arrange
-        start_date = datetime(2023, 12, 31)
-        end_date = datetime(2023, 1, 1)  # End date before start date
-        mock_transactions = []
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        filter_mock = options_mock.filter.return_value
-        filter_mock.all.return_value = mock_transactions
-
-        # Act
-        result = self.repo.get_transactions_by_date_range(start_date, end_date)
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        query_mock.options.assert_called_once()
-        options_mock.filter.assert_called_once()
-        filter_mock.all.assert_called_once()
-        self.assertEqual(result, [])
-        self.assertEqual(len(result), 0)
-
-    def test_get_transactions_by_category(self):
-        """Test retrieving transactions by category ID."""
-        # Arrange
-        category_id = 1
-        mock_transactions = [MagicMock(spec=Transaction) for _ in range(3)]
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        filter_mock = options_mock.filter.return_value
-        filter_mock.all.return_value = mock_transactions
-
-        # Act
-        result = self.repo.get_transactions_by_category(category_id)
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        query_mock.options.assert_called_once()
-        options_mock.filter.assert_called_once()
-        filter_mock.all.assert_called_once()
-        self.assertEqual(result, mock_transactions)
-
-    def test_get_transactions_by_category_nonexistent(self):
-        """Test retrieving transactions for a category that doesn't exist."""
-        # Arrange
-        category_id = 999  # Non-existent category
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        filter_mock = options_mock.filter.return_value
-        filter_mock.all.return_value = []
-
-        # Act
-        result = self.repo.get_transactions_by_category(category_id)
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        query_mock.options.assert_called_once()
-        options_mock.filter.assert_called_once()
-        filter_mock.all.assert_called_once()
-        self.assertEqual(result, [])
-        self.assertEqual(len(result), 0)
-
-    def test_get_transactions_by_category_name(self):
-        """Test retrieving transactions by category name."""
-        # Arrange
-        category_name = "Entertainment"
-        mock_transactions = [MagicMock(spec=Transaction) for _ in range(3)]
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        filter_mock = options_mock.filter.return_value
-        filter_mock.all.return_value = mock_transactions
-
-        # Act
-        result = self.repo.get_transactions_by_category_name(category_name)
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        query_mock.options.assert_called_once()
-        options_mock.filter.assert_called_once()
-        filter_mock.all.assert_called_once()
-        self.assertEqual(result, mock_transactions)
-
-    def test_get_transactions_by_category_name_nonexistent(self):
-        """Test retrieving transactions for a category name that doesn't exist."""
-        # Arrange
-        category_name = "NonExistentCategory"
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        filter_mock = options_mock.filter.return_value
-        filter_mock.all.return_value = []
-
-        # Act
-        result = self.repo.get_transactions_by_category_name(category_name)
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        query_mock.options.assert_called_once()
-        options_mock.filter.assert_called_once()
-        filter_mock.all.assert_called_once()
-        self.assertEqual(result, [])
-        self.assertEqual(len(result), 0)
-
-    def test_find_similar_transactions(self):
-        """Test finding transactions with similar descriptions using vector similarity."""
-        # Arrange
-        embedding = [0.1, 0.2, 0.3]
-        limit = 5
-        mock_transactions = [MagicMock(spec=Transaction) for _ in range(limit)]
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        filter_mock = options_mock.filter.return_value
-        order_by_mock = filter_mock.order_by.return_value
-        limit_mock = order_by_mock.limit.return_value
-        limit_mock.all.return_value = mock_transactions
-
-        # Act
-        with patch("numpy.array", return_value=np.array(embedding)) as mock_np_array:
-            result = self.repo.find_similar_transactions(embedding, limit)
-
-        # Assert
-        mock_np_array.assert_called_once_with(embedding)
-        self.mock_db.query.assert_called_once_with(Transaction)
-        query_mock.options.assert_called_once()
-        options_mock.filter.assert_called_once()
-        filter_mock.order_by.assert_called_once()
-        order_by_mock.limit.assert_called_once_with(limit)
-        limit_mock.all.assert_called_once()
-        self.assertEqual(result, mock_transactions)
-
-    def test_find_similar_transactions_empty_embedding(self):
-        """Test finding similar transactions with an empty embedding."""
-        # Arrange
-        embedding = []
-        limit = 5
-
-        # Act/Assert
-        with self.assertRaises(ValueError):
-            with patch("numpy.array", side_effect=ValueError("empty array")) as mock_np_array:
-                self.repo.find_similar_transactions(embedding, limit)
-
-        # Assert
-        mock_np_array.assert_called_once_with(embedding)
-
-    def test_find_similar_transactions_custom_limit(self):
-        """Test finding transactions with custom limit."""
-        # Arrange
-        embedding = [0.1, 0.2, 0.3]
-        limit = 10  # Custom limit
-        mock_transactions = [MagicMock(spec=Transaction) for _ in range(limit)]
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        filter_mock = options_mock.filter.return_value
-        order_by_mock = filter_mock.order_by.return_value
-        limit_mock = order_by_mock.limit.return_value
-        limit_mock.all.return_value = mock_transactions
-
-        # Act
-        with patch("numpy.array", return_value=np.array(embedding)) as mock_np_array:
-            result = self.repo.find_similar_transactions(embedding, limit)
-
-        # Assert
-        order_by_mock.limit.assert_called_once_with(limit)
-        self.assertEqual(len(result), limit)
-
-    def test_get_top_expenses(self):
-        """Test retrieving top expenses for a year."""
-        # Arrange
-        year = 2023
-        limit = 5
-        mock_transactions = [MagicMock(spec=Transaction) for _ in range(limit)]
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        where_mock = options_mock.where.return_value
-        order_by_mock = where_mock.order_by.return_value
-        limit_mock = order_by_mock.limit.return_value
-        limit_mock.all.return_value = mock_transactions
-
-        # Act
-        result = self.repo.get_top_expenses(year, limit)
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        query_mock.options.assert_called_once()
-        options_mock.where.assert_called_once()
-        where_mock.order_by.assert_called_once()
-        order_by_mock.limit.assert_called_once_with(limit)
-        limit_mock.all.assert_called_once()
-        self.assertEqual(result, mock_transactions)
-
-    def test_get_top_expenses_custom_limit(self):
-        """Test retrieving top expenses with custom limit."""
-        # Arrange
-        year = 2023
-        limit = 10
-        mock_transactions = [MagicMock(spec=Transaction) for _ in range(limit)]
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        where_mock = options_mock.where.return_value
-        order_by_mock = where_mock.order_by.return_value
-        limit_mock = order_by_mock.limit.return_value
-        limit_mock.all.return_value = mock_transactions
-
-        # Act
-        result = self.repo.get_top_expenses(year, limit)
-
-        # Assert
-        order_by_mock.limit.assert_called_once_with(limit)
-        self.assertEqual(len(result), limit)
-
-    def test_get_top_expenses_no_expenses(self):
-        """Test retrieving top expenses when no expenses exist for the year."""
-        # Arrange
-        year = 2020  # Year with no expenses
-        limit = 5
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        where_mock = options_mock.where.return_value
-        order_by_mock = where_mock.order_by.return_value
-        limit_mock = order_by_mock.limit.return_value
-        limit_mock.all.return_value = []
-
-        # Act
-        result = self.repo.get_top_expenses(year, limit)
-
-        # Assert
-        self.assertEqual(result, [])
-        self.assertEqual(len(result), 0)
-
-    def test_get_top_vendors(self):
-        """Test retrieving top vendors for a year."""
-        # Arrange
-        year = 2023
-        limit = 5
-        mock_results = [
-            ("Vendor1", 10, -500.0),
-            ("Vendor2", 5, -300.0),
-            ("Vendor3", 3, -200.0),
-        ]
-        expected_summaries = [
-            VendorSummary(vendor="Vendor1", count=10, total_amount=500.0),
-            VendorSummary(vendor="Vendor2", count=5, total_amount=300.0),
-            VendorSummary(vendor="Vendor3", count=3, total_amount=200.0),
-        ]
-
-        query_mock = self.mock_db.query.return_value
-        where_mock = query_mock.where.return_value
-        group_by_mock = where_mock.group_by.return_value
-        order_by_mock = group_by_mock.order_by.return_value
-        limit_mock = order_by_mock.limit.return_value
-        limit_mock.all.return_value = mock_results
-
-        # Act
-        result = self.repo.get_top_vendors(year, limit)
-
-        # Assert
-        self.mock_db.query.assert_called_once()
-        query_mock.where.assert_called_once()
-        where_mock.group_by.assert_called_once_with(Transaction.vendor)
-        group_by_mock.order_by.assert_called_once()
-        order_by_mock.limit.assert_called_once_with(limit)
-        limit_mock.all.assert_called_once()
-
-        self.assertEqual(len(result), len(expected_summaries))
-        for i, summary in enumerate(result):
-            self.assertEqual(summary.vendor, expected_summaries[i].vendor)
-            self.assertEqual(summary.count, expected_summaries[i].count)
-            self.assertEqual(summary.total_amount, expected_summaries[i].total_amount)
-
-    def test_get_top_vendors_custom_limit(self):
-        """Test retrieving top vendors with custom limit."""
-        # Arrange
-        year = 2023
-        limit = 10
-        mock_results = [("Vendor1", 10, -500.0)]  # Just need one for this test
-
-        query_mock = self.mock_db.query.return_value
-        where_mock = query_mock.where.return_value
-        group_by_mock = where_mock.group_by.return_value
-        order_by_mock = group_by_mock.order_by.return_value
-        limit_mock = order_by_mock.limit.return_value
-        limit_mock.all.return_value = mock_results
-
-        # Act
-        result = self.repo.get_top_vendors(year, limit)
-
-        # Assert
-        order_by_mock.limit.assert_called_once_with(limit)
-
-    def test_get_top_vendors_no_vendors(self):
-        """Test retrieving top vendors when no vendors exist for the year."""
-        # Arrange
-        year = 2020  # Year with no vendors
-        limit = 5
-
-        query_mock = self.mock_db.query.return_value
-        where_mock = query_mock.where.return_value
-        group_by_mock = where_mock.group_by.return_value
-        order_by_mock = group_by_mock.order_by.return_value
-        limit_mock = order_by_mock.limit.return_value
-        limit_mock.all.return_value = []
-
-        # Act
-        result = self.repo.get_top_vendors(year, limit)
-
-        # Assert
-        self.assertEqual(result, [])
-        self.assertEqual(len(result), 0)
-
-    def test_get_top_vendors_database_error(self):
-        """Test that get_top_vendors handles database errors."""
-        # Arrange
-        year = 2023
-        limit = 5
-
-        query_mock = self.mock_db.query.return_value
-        query_mock.where.side_effect = SQLAlchemyError("Database error")
-
-        # Act/Assert
-        with self.assertRaises(SQLAlchemyError):
-            self.repo.get_top_vendors(year, limit)
-
-    def test_get_transactions_by_year(self):
-        """Test retrieving all transactions for a specific year."""
-        # Arrange
-        year = 2023
-        mock_transactions = [MagicMock(spec=Transaction) for _ in range(10)]
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        where_mock = options_mock.where.return_value
-        where_mock.all.return_value = mock_transactions
-
-        # Act
-        result = self.repo.get_transactions_by_year(year)
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        query_mock.options.assert_called_once()
-        options_mock.where.assert_called_once()
-        where_mock.all.assert_called_once()
-        self.assertEqual(result, mock_transactions)
-
-    def test_get_transactions_by_year_no_transactions(self):
-        """Test retrieving transactions for a year with no transactions."""
-        # Arrange
-        year = 2020  # Year with no transactions
-
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        where_mock = options_mock.where.return_value
-        where_mock.all.return_value = []
-
-        # Act
-        result = self.repo.get_transactions_by_year(year)
-
-        # Assert
-        self.assertEqual(result, [])
-        self.assertEqual(len(result), 0)
-
-    def test_get_transactions_by_year_invalid_year(self):
-        """Test retrieving transactions with an invalid year format."""
-        # Arrange
-        year = "invalid_year"  # Non-integer year
-
-        # Set up the mocks to raise the expected SQLAlchemy error when extract function is called
-        query_mock = self.mock_db.query.return_value
-        options_mock = query_mock.options.return_value
-        # Simulate the error being raised when SQLAlchemy tries to process the invalid year
-        options_mock.where.side_effect = SQLAlchemyError("Invalid input syntax for type integer")
-
-        # Act/Assert
-        with self.assertRaises(SQLAlchemyError):
-            self.repo.get_transactions_by_year(year)
-
-
-if __name__ == "__main__":
-    unittest.main()
+# One exception instance shared across the error cases
+_DB_ERROR = SQLAlchemyError("Database error")
+
+# Range endpoints reused across the date tests; datetime.__new__ validates
+# its arguments, so the literals are built once instead of per test
+_DATE_2023_JAN1 = datetime(2023, 1, 1)
+_DATE_2023_DEC31 = datetime(2023, 12, 31)
+
+_MOCK_VENDOR_ROWS = (
+    ("Vendor1", 10, -500.0),
+    ("Vendor2", 5, -300.0),
+    ("Vendor3", 3, -200.0),
+)
+_EXPECTED_VENDOR_SUMMARIES = (
+    VendorSummary(vendor="Vendor1", count=10, total_amount=500.0),
+    VendorSummary(vendor="Vendor2", count=5, total_amount=300.0),
+    VendorSummary(vendor="Vendor3", count=3, total_amount=200.0),
+)
+
+
+@pytest.fixture
+def repo(transaction_category_repo):
+    """Repository under test, bound to the shared session mock."""
+    return transaction_category_repo
+
+
+def _run_query_chain_case(repo, mock_db, method_name, chain_path, leaf_attr, return_value, *args):
+    """Wire a single query chain on the session mock and run a repo method.
+
+    Walks chain_path from the query mock, sets the leaf return value, calls
+    the repository method, and asserts each link was called once. Returns
+    the result and the chain's call mocks for per-case assertions."""
+    node = mock_db.query.return_value
+    chain_calls = []
+    for step in chain_path:
+        call_mock = getattr(node, step)
+        chain_calls.append(call_mock)
+        node = call_mock.return_value
+    getattr(node, leaf_attr).return_value = return_value
+
+    result = getattr(repo, method_name)(*args)
+
+    mock_db.query.assert_called_once()
+    for call_mock in chain_calls:
+        call_mock.assert_called_once()
+    getattr(node, leaf_attr).assert_called_once()
+    return result, chain_calls
+
+
+def test_init_creates_logger(mock_db):
+    """Test that logger is created during initialization."""
+    # Act
+    repo = TransactionCategoryRepository(mock_db)
+
+    # Assert
+    assert repo.logger is not None
+    assert repo.logger.name == _LOGGER_NAME
+
+
+def test_logger_debug_called(mock_db):
+    """Test that logger.debug is called during initialization."""
+    # Arrange
+    mock_logger = MagicMock()
+
+    # Act
+    with patch(
+        "expense_analyzer.database.repositories.transaction_category_repository.logging.getLogger",
+        return_value=mock_logger,
+    ) as mock_get_logger:
+        repo = TransactionCategoryRepository(mock_db)
+
+    # Assert
+    mock_get_logger.assert_called_once_with(_LOGGER_NAME)
+    mock_logger.debug.assert_called_once_with("TransactionCategoryRepository initialized")
+
+
+@pytest.mark.parametrize("transactions", [fake_tx_list(3), []])
+def test_get_transactions(repo, mock_db, transactions):
+    """Test retrieving all transactions for populated and empty results."""
+    result, _ = _run_query_chain_case(repo, mock_db, "get_transactions", ["options"], "all", transactions)
+    assert result == transactions
+
+
+@pytest.mark.parametrize(
+    "method_name, chain_path, args",
+    [
+        ("get_transactions", ["options", "all"], ()),
+        ("get_top_vendors", ["where"], (2023, 5)),
+        ("get_transactions_by_year", ["options", "where"], ("invalid_year",)),
+    ],
+)
+def test_repository_error_propagation(repo, mock_db, method_name, chain_path, args):
+    """Test that SQLAlchemy errors raised anywhere in a query chain propagate."""
+    # Arrange: make the call at the end of chain_path raise
+    node = mock_db.query.return_value
+    for step in chain_path[:-1]:
+        node = getattr(node, step).return_value
+    getattr(node, chain_path[-1]).side_effect = _DB_ERROR
+
+    # Act/Assert
+    with pytest.raises(SQLAlchemyError):
+        getattr(repo, method_name)(*args)
+
+
+@pytest.mark.parametrize("transaction_id, expected", [(1, fake_tx_list(1)[0]), (999, None)])
+def test_get_transaction(repo, mock_db, transaction_id, expected):
+    """Test retrieving a transaction by ID when it exists and when it does not."""
+    result, _ = _run_query_chain_case(
+        repo, mock_db, "get_transaction", ["options", "filter"], "first", expected, transaction_id
+    )
+    assert result == expected
+
+
+@pytest.mark.parametrize("transactions", [fake_tx_list(2), []])
+def test_get_transactions_with_category(repo, mock_db, transactions):
+    """Test retrieving categorized transactions for populated and empty results."""
+    result, _ = _run_query_chain_case(
+        repo, mock_db, "get_transactions_with_category", ["options", "filter"], "all", transactions
+    )
+    assert result == transactions
+
+
+@pytest.mark.parametrize(
+    "start_date, end_date, transactions",
+    [
+        (_DATE_2023_JAN1, _DATE_2023_DEC31, fake_tx_list(5)),
+        (_DATE_2023_DEC31, _DATE_2023_JAN1, []),  # End date before start date
+    ],
+)
+def test_get_transactions_by_date_range(repo, mock_db, start_date, end_date, transactions):
+    """Test retrieving transactions for valid and inverted date ranges."""
+    result, _ = _run_query_chain_case(
+        repo,
+        mock_db,
+        "get_transactions_by_date_range",
+        ["options", "filter"],
+        "all",
+        transactions,
+        start_date,
+        end_date,
+    )
+    assert result == transactions
+
+
+def test_get_transactions_by_date_range_iter(repo, mock_db):
+    """Test streaming transactions within a date range."""
+    # Arrange
+    mock_transactions = fake_tx_list(3)
+    query = FakeQuery(mock_transactions)
+    mock_db.query.return_value = query
+
+    # Act
+    result = list(repo.get_transactions_by_date_range_iter(_DATE_2023_JAN1, _DATE_2023_DEC31))
+
+    # Assert
+    mock_db.query.assert_called_once_with(Transaction)
+    assert query.execution_options_kwargs == {"stream_results": True}
+    assert query.yield_per_arg == 1000
+    assert result == mock_transactions
+
+
+@pytest.mark.parametrize("category_id, transactions", [(1, fake_tx_list(3)), (999, [])])
+def test_get_transactions_by_category(repo, mock_db, category_id, transactions):
+    """Test retrieving transactions for existing and non-existent category IDs."""
+    result, _ = _run_query_chain_case(
+        repo, mock_db, "get_transactions_by_category", ["options", "filter"], "all", transactions, category_id
+    )
+    assert result == transactions
+
+
+@pytest.mark.parametrize(
+    "category_name, transactions", [("Entertainment", fake_tx_list(3)), ("NonExistentCategory", [])]
+)
+def test_get_transactions_by_category_name(repo, mock_db, category_name, transactions):
+    """Test retrieving transactions for existing and non-existent category names."""
+    result, _ = _run_query_chain_case(
+        repo, mock_db, "get_transactions_by_category_name", ["options", "filter"], "all", transactions, category_name
+    )
+    assert result == transactions
+
+
+def test_find_similar_transactions(repo, mock_db):
+    """Test finding transactions with similar descriptions using vector similarity."""
+    # Arrange
+    embedding = [0.1, 0.2, 0.3]
+    limit = 5
+    mock_transactions = fake_tx_list(limit)
+    query = FakeQuery(mock_transactions)
+    mock_db.query.return_value = query
+
+    # Act
+    with patch(
+        "expense_analyzer.database.repositories.transaction_category_repository.np.array",
+        return_value=MagicMock(),
+    ) as mock_np_array:
+        result = repo.find_similar_transactions(embedding, limit)
+
+    # Assert
+    mock_np_array.assert_called_once_with(embedding)
+    mock_db.query.assert_called_once_with(Transaction)
+    assert query.limit_arg == limit
+    assert result == mock_transactions
+
+
+def test_find_similar_transactions_empty_embedding(repo, mock_db):
+    """Test finding similar transactions with an empty embedding."""
+    # Arrange
+    embedding = []
+    limit = 5
+
+    # Act/Assert
+    with patch(
+        "expense_analyzer.database.repositories.transaction_category_repository.np.array",
+        side_effect=ValueError("empty array"),
+    ) as mock_np_array, pytest.raises(ValueError):
+        repo.find_similar_transactions(embedding, limit)
+
+    # Assert
+    mock_np_array.assert_called_once_with(embedding)
+
+
+def test_find_similar_transactions_custom_limit(repo, mock_db):
+    """Test finding transactions with custom limit."""
+    # Arrange
+    embedding = [0.1, 0.2, 0.3]
+    limit = 10  # Custom limit
+    mock_transactions = fake_tx_list(limit)
+    query = FakeQuery(mock_transactions)
+    mock_db.query.return_value = query
+
+    # Act
+    with patch(
+        "expense_analyzer.database.repositories.transaction_category_repository.np.array",
+        return_value=MagicMock(),
+    ):
+        result = repo.find_similar_transactions(embedding, limit)
+
+    # Assert
+    assert query.limit_arg == limit
+    assert len(result) == limit
+
+
+@pytest.mark.parametrize(
+    "year, limit, transactions",
+    [
+        (2023, 5, fake_tx_list(5)),
+        (2023, 10, fake_tx_list(10)),
+        (2020, 5, []),  # Year with no expenses
+    ],
+)
+def test_get_top_expenses(repo, mock_db, year, limit, transactions):
+    """Test retrieving top expenses across default, custom-limit and empty results."""
+    query = FakeQuery(transactions)
+    mock_db.query.return_value = query
+
+    result = repo.get_top_expenses(year, limit)
+
+    assert query.limit_arg == limit
+    assert result == transactions
+
+
+@pytest.mark.parametrize(
+    "limit, rows, expected",
+    [
+        (5, _MOCK_VENDOR_ROWS, _EXPECTED_VENDOR_SUMMARIES),
+        (10, _MOCK_VENDOR_ROWS[:1], _EXPECTED_VENDOR_SUMMARIES[:1]),
+        (5, [], []),  # Year with no vendors
+    ],
+)
+def test_get_top_vendors(repo, mock_db, limit, rows, expected):
+    """Test retrieving top vendors across default, custom-limit and empty results."""
+    result, chain_calls = _run_query_chain_case(
+        repo, mock_db, "get_top_vendors", ["where", "group_by", "order_by", "limit"], "all", list(rows), 2023, limit
+    )
+    chain_calls[-1].assert_called_once_with(limit)
+    # One tuple comparison instead of three assertions per summary; the
+    # failure diff also shows every field at once
+    assert [(s.vendor, s.count, s.total_amount) for s in result] == [
+        (e.vendor, e.count, e.total_amount) for e in expected
+    ]
+
+
+@pytest.mark.parametrize("year, transactions", [(2023, fake_tx_list(10)), (2020, [])])
+def test_get_transactions_by_year(repo, mock_db, year, transactions):
+    """Test retrieving transactions for years with and without data."""
+    result, _ = _run_query_chain_case(
+        repo, mock_db, "get_transactions_by_year", ["options", "where"], "all", transactions, year
+    )
+    assert result == transactions
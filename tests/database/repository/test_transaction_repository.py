@@ -1,143 +1,142 @@
 """Unit tests for the TransactionRepository class."""
 
-import unittest
+import types
 from datetime import date
-from unittest.mock import MagicMock, patch
 
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+import pytest
 
-from expense_analyzer.database.models import Transaction
-from expense_analyzer.database.repositories.transaction_repository import (
-    TransactionRepository,
-)
+from expense_analyzer.database.models import Category
 from expense_analyzer.models.source import Source
 
+# Enum member bound once at module load instead of looked up per test
+_BOA = Source.BANK_OF_AMERICA
+
+# Dates reused across tests, built once instead of per test
+_DATE_2025_JAN1 = date(2025, 1, 1)
+_DATE_2025_MAR1 = date(2025, 3, 1)
+_DATE_2025_MAR31 = date(2025, 3, 31)
+
+# Invariant transaction data, shared read-only; tests copy before mutating
+_TX_TEMPLATE = types.MappingProxyType(
+    {
+        "vendor": "Test Vendor",
+        "amount": -100.0,
+        "date": _DATE_2025_MAR1,
+        "description": "Test transaction",
+        "source": _BOA,
+    }
+)
+
+
+@pytest.fixture
+def repo(transaction_repo):
+    """Repository under test, backed by the rolled-back SQLite session."""
+    return transaction_repo
+
+
+@pytest.fixture
+def transaction_data():
+    """Mutable per-test copy of the shared template."""
+    return dict(_TX_TEMPLATE)
+
+
+def test_create_unique_transaction(repo):
+    """Test creating a new unique transaction succeeds."""
+    # Act: create_transaction reads the data without mutating, so the
+    # read-only template is passed as-is
+    result = repo.create_transaction(_TX_TEMPLATE)
+
+    # Assert
+    assert result.id is not None
+    assert result.vendor == _TX_TEMPLATE["vendor"]
+    assert result.amount == _TX_TEMPLATE["amount"]
+    assert result.date == _TX_TEMPLATE["date"]
+    assert result.description == _TX_TEMPLATE["description"]
+    assert result.source == _TX_TEMPLATE["source"]
+
+
+def test_create_duplicate_transaction(repo):
+    """Test creating a duplicate transaction rolls back and returns None."""
+    # Arrange
+    assert repo.create_transaction(_TX_TEMPLATE) is not None
+
+    # Act
+    result = repo.create_transaction(_TX_TEMPLATE)
+
+    # Assert
+    assert result is None
+    assert len(repo.get_all_transactions()) == 1
+
+
+def test_create_transaction_with_null_description(repo, transaction_data):
+    """Test that null descriptions are distinct under the uniqueness constraint.
+
+    SQL treats NULLs as distinct in unique constraints, so two otherwise
+    identical rows with no description both insert."""
+    # Arrange
+    del transaction_data["description"]
+    first = repo.create_transaction(dict(transaction_data))
+    assert first is not None
+    assert first.description is None
+
+    # Act
+    result = repo.create_transaction(dict(transaction_data))
+
+    # Assert
+    assert result is not None
+    assert len(repo.get_all_transactions()) == 2
+
+
+def test_get_transaction(repo):
+    """Test retrieving a transaction by ID."""
+    # Arrange
+    created = repo.create_transaction(_TX_TEMPLATE)
+
+    # Act
+    result = repo.get_transaction(created.id)
+
+    # Assert
+    assert result is created
+
+
+def test_get_transaction_not_found(repo):
+    """Test retrieving a non-existent transaction by ID."""
+    assert repo.get_transaction(999) is None
+
+
+def test_get_all_transactions(repo, sql_counter):
+    """Test retrieving all transactions in a single statement."""
+    # Arrange: vary the amount so the rows clear the uniqueness constraint
+    for offset in range(3):
+        repo.create_transaction(dict(_TX_TEMPLATE, amount=-100.0 - offset))
+    sql_counter.reset()
+
+    # Act
+    result = repo.get_all_transactions()
+
+    # Assert
+    assert len(result) == 3
+    assert sql_counter.count == 1
+
+
+def test_get_transactions_by_date_range(repo, sql_counter):
+    """Test retrieving transactions within a date range without N+1 loads."""
+    # Arrange: one categorized row inside the range, one before it
+    category = Category(name="Test Category")
+    repo.db.add(category)
+    repo.db.commit()
+    in_range = repo.create_transaction(dict(_TX_TEMPLATE, category_id=category.id))
+    repo.create_transaction(dict(_TX_TEMPLATE, date=date(2024, 12, 31)))
+    sql_counter.reset()
+
+    # Act
+    result = repo.get_transactions_by_date_range(_DATE_2025_JAN1, _DATE_2025_MAR31)
+
+    # Assert: one SELECT plus one selectinload batch for the categories,
+    # constant no matter how many rows match
+    assert result == [in_range]
+    assert sql_counter.count == 2
 
-class TestTransactionRepository(unittest.TestCase):
-    """Test cases for the TransactionRepository class."""
-
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.mock_db = MagicMock(spec=Session)
-        self.repo = TransactionRepository(self.mock_db)
-
-        # Common test data
-        self.transaction_data = {
-            "vendor": "Test Vendor",
-            "amount": -100.0,
-            "date": date(2025, 3, 1),
-            "description": "Test transaction",
-            "source": Source.BANK_OF_AMERICA,
-        }
-
-    def test_create_unique_transaction(self):
-        """Test creating a new unique transaction succeeds."""
-        # Arrange
-        self.mock_db.commit.return_value = None  # Normal commit, no exception
-
-        # Act
-        result = self.repo.create_transaction(self.transaction_data)
-
-        # Assert
-        self.mock_db.add.assert_called_once()
-        self.mock_db.commit.assert_called_once()
-        self.mock_db.refresh.assert_called_once()
-        self.assertEqual(result.vendor, self.transaction_data["vendor"])
-        self.assertEqual(result.amount, self.transaction_data["amount"])
-        self.assertEqual(result.date, self.transaction_data["date"])
-        self.assertEqual(result.description, self.transaction_data["description"])
-        self.assertEqual(result.source, self.transaction_data["source"])
-
-    def test_create_duplicate_transaction(self):
-        """Test creating a duplicate transaction returns existing transaction."""
-        # Arrange
-        existing_transaction = Transaction(**self.transaction_data)
-
-        # Mock the commit to raise IntegrityError
-        self.mock_db.commit.side_effect = IntegrityError("statement", "params", "orig")
-
-        # Mock the query to return existing transaction after rollback
-        self.mock_db.query.return_value.filter.return_value.first.return_value = existing_transaction
-
-        # Act
-        result = self.repo.create_transaction(self.transaction_data)
-
-        # Assert
-        self.mock_db.add.assert_called_once()
-        self.mock_db.commit.assert_called_once()
-        self.mock_db.rollback.assert_called_once()
-        self.assertIsNone(result)
-
-    def test_create_transaction_with_null_description(self):
-        """Test creating transactions with null descriptions are still checked for uniqueness."""
-        # Arrange
-        transaction_data_no_description = self.transaction_data.copy()
-        del transaction_data_no_description["description"]
-
-        existing_transaction = Transaction(**transaction_data_no_description)
-
-        # Mock the commit to raise IntegrityError
-        self.mock_db.commit.side_effect = IntegrityError("statement", "params", "orig")
-
-        # Mock the query to return existing transaction after rollback
-        self.mock_db.query.return_value.filter.return_value.first.return_value = existing_transaction
-
-        # Act
-        result = self.repo.create_transaction(transaction_data_no_description)
-
-        # Assert
-        self.mock_db.add.assert_called_once()
-        self.mock_db.commit.assert_called_once()
-        self.mock_db.rollback.assert_called_once()
-        self.assertIsNone(result)
-
-    def test_get_transaction(self):
-        """Test retrieving a transaction by ID."""
-        # Arrange
-        transaction_id = 1
-        mock_transaction = MagicMock(spec=Transaction)
-        mock_transaction.id = transaction_id
-        self.mock_db.query.return_value.filter.return_value.first.return_value = mock_transaction
-
-        # Act
-        result = self.repo.get_transaction(transaction_id)
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        self.mock_db.query.return_value.filter.assert_called_once()
-        self.assertEqual(result, mock_transaction)
-
-    def test_get_all_transactions(self):
-        """Test retrieving all transactions."""
-        # Arrange
-        mock_transactions = [MagicMock(spec=Transaction) for _ in range(3)]
-        self.mock_db.query.return_value.all.return_value = mock_transactions
-
-        # Act
-        result = self.repo.get_all_transactions()
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        self.mock_db.query.return_value.all.assert_called_once()
-        self.assertEqual(result, mock_transactions)
-
-    def test_get_transactions_by_date_range(self):
-        """Test retrieving transactions within a date range."""
-        # Arrange
-        start_date = date(2025, 1, 1)
-        end_date = date(2025, 3, 31)
-        mock_transactions = [MagicMock(spec=Transaction) for _ in range(2)]
-        self.mock_db.query.return_value.filter.return_value.all.return_value = mock_transactions
-
-        # Act
-        result = self.repo.get_transactions_by_date_range(start_date, end_date)
-
-        # Assert
-        self.mock_db.query.assert_called_once_with(Transaction)
-        self.mock_db.query.return_value.filter.assert_called_once()
-        self.assertEqual(result, mock_transactions)
-
-
-if __name__ == "__main__":
-    unittest.main()
+    # Touching the eager-loaded relationship must not issue more SQL
+    _ = [transaction.category for transaction in result]
+    assert sql_counter.count == 2
@@ -1,75 +1,79 @@
 """Unit tests for the database models."""
 
-import unittest
 from datetime import date
 
+from sqlalchemy import insert
+
 from expense_analyzer.database.models import Category, Transaction
 from expense_analyzer.models.source import Source
 
+# Enum member bound once at module load instead of looked up per row
+_BOA = Source.BANK_OF_AMERICA
+
+# Property matrix rows, inserted with a single Core statement
+_PROPERTY_ROWS = [
+    {
+        "vendor": "Test Vendor",
+        "amount": -100.0,
+        "date": date(2025, 3, 1),
+        "description": "Test expense",
+        "source": _BOA,
+    },
+    {
+        "vendor": "Test Vendor",
+        "amount": 200.0,
+        "date": date(2025, 3, 1),
+        "description": "Test income",
+        "source": _BOA,
+    },
+    {
+        "vendor": "Test Vendor",
+        "amount": 0.0,
+        "date": date(2025, 3, 1),
+        "description": "Test zero",
+        "source": _BOA,
+    },
+]
+
+
+def _make_transactions(db_session, rows):
+    """Insert rows as one batched Core statement and return the hydrated objects."""
+    db_session.execute(insert(Transaction), rows)
+    db_session.expire_all()
+    return db_session.query(Transaction).order_by(Transaction.id).all()
+
+
+def test_transaction_properties(db_session):
+    """Test the transaction properties on rows hydrated from the database."""
+    expense, income, zero = _make_transactions(db_session, _PROPERTY_ROWS)
+
+    assert expense.is_expense
+    assert not expense.is_income
+    assert expense.absolute_amount == 100.0
+
+    assert not income.is_expense
+    assert income.is_income
+    assert income.absolute_amount == 200.0
+
+    assert not zero.is_expense
+    assert not zero.is_income
+    assert zero.absolute_amount == 0.0
+
+
+def test_category_relationships():
+    """Test the category relationships."""
+    # Create parent category
+    parent = Category(name="Parent Category")
+
+    # Create child category
+    child = Category(name="Child Category", parent_id=1)  # Assuming parent.id would be 1
+
+    # In a real database, we would set child.parent = parent
+    # For this test, we'll manually set up the relationship
+    parent.subcategories = [child]
+    child.parent = parent
 
-class TestTransactionModel(unittest.TestCase):
-    """Test cases for the Transaction model."""
-
-    def test_transaction_properties(self):
-        """Test the transaction properties."""
-        # Test expense
-        expense = Transaction(
-            vendor="Test Vendor",
-            amount=-100.0,
-            date=date(2025, 3, 1),
-            description="Test expense",
-            source=Source.BANK_OF_AMERICA,
-        )
-        self.assertTrue(expense.is_expense)
-        self.assertFalse(expense.is_income)
-        self.assertEqual(expense.absolute_amount, 100.0)
-
-        # Test income
-        income = Transaction(
-            vendor="Test Vendor",
-            amount=200.0,
-            date=date(2025, 3, 1),
-            description="Test income",
-            source=Source.BANK_OF_AMERICA,
-        )
-        self.assertFalse(income.is_expense)
-        self.assertTrue(income.is_income)
-        self.assertEqual(income.absolute_amount, 200.0)
-
-        # Test zero amount
-        zero = Transaction(
-            vendor="Test Vendor",
-            amount=0.0,
-            date=date(2025, 3, 1),
-            description="Test zero",
-            source=Source.BANK_OF_AMERICA,
-        )
-        self.assertFalse(zero.is_expense)
-        self.assertFalse(zero.is_income)
-        self.assertEqual(zero.absolute_amount, 0.0)
-
-
-class TestCategoryModel(unittest.TestCase):
-    """Test cases for the Category model."""
-
-    def test_category_relationships(self):
-        """Test the category relationships."""
-        # Create parent category
-        parent = Category(name="Parent Category")
-
-        # Create child category
-        child = Category(name="Child Category", parent_id=1)  # Assuming parent.id would be 1
-
-        # In a real database, we would set child.parent = parent
-        # For this test, we'll manually set up the relationship
-        parent.subcategories = [child]
-        child.parent = parent
-
-        # Test relationships
-        self.assertEqual(child.parent, parent)
-        self.assertIn(child, parent.subcategories)
-        self.assertEqual(len(parent.subcategories), 1)
-
-
-if __name__ == "__main__":
-    unittest.main()
+    # Test relationships
+    assert child.parent == parent
+    assert child in parent.subcategories
+    assert len(parent.subcategories) == 1
@@ -0,0 +1,135 @@
+"""Shared fixtures for the service unit tests.
+
+The data here is never mutated by any test, so it is built once per
+session instead of per test; the one mutable object (the expense tests'
+db_transaction) stays a function-scoped fixture in its own module."""
+
+import functools
+import types
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+import expense_analyzer.services.expense_service as expense_service_module
+import expense_analyzer.services.report_service as report_service_module
+from expense_analyzer.database.models import Category, Transaction, VendorSummary
+from expense_analyzer.models.source import Source
+from expense_analyzer.models.transaction import ReportTransaction
+
+# Single fake session shared by every service test on a worker
+_FAKE_DB = MagicMock()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stub_get_db():
+    """Point both service modules' get_db at the shared fake session.
+
+    get_db is stubbed identically everywhere, so one direct assignment per
+    worker replaces a patcher start/stop in every test; the originals are
+    restored on session teardown."""
+    originals = (expense_service_module.get_db, report_service_module.get_db)
+    expense_service_module.get_db = lambda: _FAKE_DB
+    report_service_module.get_db = lambda: _FAKE_DB
+    yield
+    expense_service_module.get_db, report_service_module.get_db = originals
+
+
+@pytest.fixture
+def service_db():
+    """The shared fake session, reset for the current test."""
+    _FAKE_DB.reset_mock(return_value=True, side_effect=True)
+    return _FAKE_DB
+
+
+@functools.lru_cache(maxsize=None)
+def cached_report_transaction(items):
+    """ReportTransaction parsed once per unique field tuple.
+
+    Tests that build their own transaction from a dict should go through
+    here (key on tuple(sorted(d.items()))) so repeated parsing of the same
+    fields is memoized for the life of the worker."""
+    return ReportTransaction(dict(items))
+
+
+# Raw transaction fields frozen at import; the proxy cannot be mutated, so
+# the dict and the object parsed from it are safe to share everywhere
+REPORT_TX_DICT = types.MappingProxyType(
+    {
+        "id": 1,
+        "vendor": "Test Vendor",
+        "amount": -100.0,
+        "date": "2025-03-01",
+        "description": "Test transaction",
+        "source": Source.BANK_OF_AMERICA,
+    }
+)
+REPORT_TX = cached_report_transaction(tuple(sorted(REPORT_TX_DICT.items())))
+
+
+@pytest.fixture(scope="session")
+def report_transaction_dict():
+    """Read-only view of the raw transaction fields."""
+    return REPORT_TX_DICT
+
+
+@pytest.fixture(scope="session")
+def report_transaction():
+    """ReportTransaction parsed once at import from the frozen dictionary."""
+    return REPORT_TX
+
+
+@functools.lru_cache(maxsize=None)
+def cached_category(id, name, parent_id=None):
+    """Category built once per unique field tuple.
+
+    Declarative __init__ runs SQLAlchemy's attribute instrumentation, so
+    ad-hoc Category construction in tests should go through here; the
+    cached instances are never mutated."""
+    return Category(id=id, name=name, parent_id=parent_id)
+
+
+@pytest.fixture(scope="session")
+def test_category():
+    """Category the mocked categorizer assigns."""
+    return cached_category(1, "Test Category")
+
+
+@pytest.fixture(scope="session")
+def parent_category():
+    """Root category the test transactions roll up to."""
+    return cached_category(1, "Food")
+
+
+@pytest.fixture(scope="session")
+def sub_category(parent_category):
+    """Subcategory the test transactions are assigned to."""
+    return cached_category(2, "Dining", parent_id=parent_category.id)
+
+
+@pytest.fixture(scope="session")
+def test_categories(parent_category, sub_category):
+    """Full category list handed to the mapping helpers."""
+    return [parent_category, sub_category]
+
+
+@pytest.fixture(scope="session")
+def test_transaction(sub_category):
+    """Categorized transaction used across the report tests."""
+    return Transaction(
+        id=1,
+        vendor="Test Restaurant",
+        amount=-50.0,
+        date=date(2023, 3, 15),
+        description="Dinner",
+        category_id=sub_category.id,
+    )
+
+
+@pytest.fixture(scope="session")
+def test_vendor_summaries():
+    """Vendor summaries as the repository would return them."""
+    return [
+        VendorSummary(vendor="Test Restaurant", total_amount=150.0, count=3),
+        VendorSummary(vendor="Grocery Store", total_amount=120.0, count=2),
+    ]
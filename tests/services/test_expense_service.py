@@ -1,324 +1,376 @@
 """Unit tests for the ExpenseService class."""
 
-import unittest
 from datetime import date, datetime
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
-from expense_analyzer.database.models import Category, Transaction
-from expense_analyzer.embedder.transaction_embedder import TransactionEmbedder
+import pytest
+
+import expense_analyzer.services.expense_service as expense_service_module
+from expense_analyzer.database.models import Transaction
 from expense_analyzer.models.source import Source
-from expense_analyzer.models.transaction import ReportTransaction
 from expense_analyzer.services.expense_service import ExpenseService
 
+# Collaborators replaced on the service module, in constructor order;
+# get_db is stubbed for the whole session in conftest
+_PATCH_TARGETS = (
+    ("transaction_repo", "TransactionRepository"),
+    ("category_repo", "CategoryRepository"),
+    ("transaction_category_repo", "TransactionCategoryRepository"),
+    ("embedder", "TransactionEmbedder"),
+    ("categorizer", "SimpleCategorizer"),
+)
+
+# Collaborator mocks built once per worker; MagicMock construction installs
+# call-tracking state each time, so the instances are shared and reset per test
+_MOCK_POOL = {name: MagicMock() for name, _ in _PATCH_TARGETS}
+
+
+@pytest.fixture
+def ctx(monkeypatch, service_db):
+    """ExpenseService built against patched collaborators, bundled with its mocks.
+
+    monkeypatch.setattr swaps the module attributes by direct assignment,
+    which skips the mock.patch start/stop machinery the old stacked
+    decorators paid for on every test method; the pooled mocks are reset
+    rather than rebuilt."""
+    expense_service_module._similarity_cache.clear()
+    mocks = SimpleNamespace(db=service_db)
+    for name, attr in _PATCH_TARGETS:
+        mock = _MOCK_POOL[name]
+        mock.reset_mock(return_value=True, side_effect=True)
+        setattr(mocks, name, mock)
+        monkeypatch.setattr(expense_service_module, attr, lambda *args, _mock=mock, **kwargs: _mock)
+    mocks.service = ExpenseService()
+    return mocks
+
+
+@pytest.fixture
+def db_transaction(test_category):
+    """Categorized database Transaction; tests mutate it freely."""
+    transaction = Transaction(
+        id=1,
+        vendor="Test Vendor",
+        amount=-100.0,
+        date=date(2025, 3, 1),
+        description="Test transaction",
+        source=Source.BANK_OF_AMERICA,
+    )
+    transaction.category = test_category
+    return transaction
+
+
+# Simple mock embedding, shared read-only
+_TEST_EMBEDDING = [0.1, 0.2, 0.3]
+
+# The similar-transaction stand-ins are only compared by identity, so a
+# SimpleNamespace skips the spec walk a MagicMock(spec=Transaction) would do
+_SIMILAR_TX_POOL = tuple(SimpleNamespace(id=i) for i in range(10))
+
+
+class Capture:
+    """Minimal recording callable for argument inspection.
+
+    Appends (args, kwargs) per call without MagicMock's child-mock and
+    _Call bookkeeping; use where a test reads call_args."""
+
+    def __init__(self, ret=None):
+        self.calls = []
+        self.ret = ret
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.ret
+
+
+def test_init(ctx):
+    """Test service initialization."""
+    assert ctx.service is not None
+    assert ctx.service.db == ctx.db
+    assert ctx.service.transaction_repository == ctx.transaction_repo
+    assert ctx.service.category_repository == ctx.category_repo
+    assert ctx.service.transaction_category_repository == ctx.transaction_category_repo
+    assert ctx.service.embedder == ctx.embedder
+    assert ctx.service.categorizer == ctx.categorizer
+
+
+def test_enter_exit(ctx):
+    """Test context manager behavior."""
+    with ctx.service as service:
+        assert service == ctx.service
+    ctx.db.close.assert_called_once()
+
+
+def test_close(ctx):
+    """Test explicit close method."""
+    ctx.service.close()
+    ctx.db.close.assert_called_once()
+
+
+def test_convert_report_transactions_to_database_transactions(ctx, report_transaction):
+    """Test converting ReportTransaction objects to database-compatible dictionaries."""
+    # Act
+    result = ctx.service._convert_report_transactions_to_database_transactions([report_transaction])
+
+    # Assert
+    assert len(result) == 1
+    assert result[0]["vendor"] == "Test Vendor"
+    assert result[0]["amount"] == -100.0
+    assert result[0]["date"] == "2025-03-01"
+    assert result[0]["description"] == "Test transaction"
+    assert result[0]["source"] == Source.BANK_OF_AMERICA
+
+
+@pytest.mark.parametrize(
+    "category_match, creation_succeeds, expected_count",
+    [
+        (True, True, 1),
+        (False, True, 1),
+        (True, False, 0),
+    ],
+    ids=["categorized", "no_category_match", "creation_failure"],
+)
+def test_insert_transactions(
+    ctx,
+    monkeypatch,
+    report_transaction,
+    test_category,
+    db_transaction,
+    category_match,
+    creation_succeeds,
+    expected_count,
+):
+    """Test inserting transactions across categorized, uncategorized and failed creation."""
+    # Arrange: monkeypatch reverts the Capture so it never leaks onto the
+    # pooled mock, which reset_mock alone would not undo
+    ctx.category_repo.get_all_subcategories.return_value = [test_category]
+    ctx.categorizer.categorize.return_value = test_category if category_match else None
+    ctx.embedder.embed_transaction.return_value = _TEST_EMBEDDING
+    create_transaction = Capture(ret=db_transaction if creation_succeeds else None)
+    monkeypatch.setattr(ctx.transaction_repo, "create_transaction", create_transaction)
+
+    # Act
+    result = ctx.service.insert_transactions([report_transaction])
+
+    # Assert
+    assert result == expected_count
+    ctx.category_repo.get_all_subcategories.assert_called_once()
+    ctx.categorizer.categorize.assert_called_once()
+    ctx.embedder.embed_transaction.assert_called()
+    assert len(create_transaction.calls) == 1
+
+    if not category_match:
+        # Verify the transaction was created without a category_id
+        called_transaction = create_transaction.calls[0][0][0]
+        assert "category_id" not in called_transaction
 
-class TestExpenseService(unittest.TestCase):
-    """Test cases for the ExpenseService class."""
-
-    @patch("expense_analyzer.services.expense_service.get_db")
-    @patch("expense_analyzer.services.expense_service.TransactionRepository")
-    @patch("expense_analyzer.services.expense_service.CategoryRepository")
-    @patch("expense_analyzer.services.expense_service.TransactionCategoryRepository")
-    @patch("expense_analyzer.services.expense_service.TransactionEmbedder")
-    @patch("expense_analyzer.services.expense_service.SimpleCategorizer")
-    def setUp(
-        self,
-        mock_categorizer_class,
-        mock_embedder_class,
-        mock_transaction_category_repo_class,
-        mock_category_repo_class,
-        mock_transaction_repo_class,
-        mock_get_db,
-    ):
-        """Set up test fixtures before each test method."""
-        # Setup mocks
-        self.mock_db = MagicMock()
-        mock_get_db.return_value = self.mock_db
-
-        self.mock_transaction_repo = MagicMock()
-        mock_transaction_repo_class.return_value = self.mock_transaction_repo
-
-        self.mock_category_repo = MagicMock()
-        mock_category_repo_class.return_value = self.mock_category_repo
-
-        self.mock_transaction_category_repo = MagicMock()
-        mock_transaction_category_repo_class.return_value = self.mock_transaction_category_repo
-
-        self.mock_embedder = MagicMock()
-        mock_embedder_class.return_value = self.mock_embedder
-
-        self.mock_categorizer = MagicMock()
-        mock_categorizer_class.return_value = self.mock_categorizer
-
-        # Initialize service
-        self.service = ExpenseService()
-
-        # Common test data
-        self.report_transaction_dict = {
-            "id": 1,
-            "vendor": "Test Vendor",
-            "amount": -100.0,
-            "date": "2025-03-01",
-            "description": "Test transaction",
-            "source": Source.BANK_OF_AMERICA,
-        }
-
-        self.report_transaction = ReportTransaction(self.report_transaction_dict)
-
-        self.db_transaction = Transaction(
-            id=1,
-            vendor="Test Vendor",
-            amount=-100.0,
-            date=date(2025, 3, 1),
-            description="Test transaction",
-            source=Source.BANK_OF_AMERICA,
-        )
-
-        self.test_category = Category(id=1, name="Test Category")
-        self.db_transaction.category = self.test_category
-
-        self.test_embedding = [0.1, 0.2, 0.3]  # Simple mock embedding
-
-    def test_init(self):
-        """Test service initialization."""
-        self.assertIsNotNone(self.service)
-        self.assertEqual(self.service.db, self.mock_db)
-        self.assertEqual(self.service.transaction_repository, self.mock_transaction_repo)
-        self.assertEqual(self.service.category_repository, self.mock_category_repo)
-        self.assertEqual(self.service.transaction_category_repository, self.mock_transaction_category_repo)
-        self.assertEqual(self.service.embedder, self.mock_embedder)
-        self.assertEqual(self.service.categorizer, self.mock_categorizer)
-
-    def test_enter_exit(self):
-        """Test context manager behavior."""
-        with self.service as service:
-            self.assertEqual(service, self.service)
-        self.mock_db.close.assert_called_once()
-
-    def test_close(self):
-        """Test explicit close method."""
-        self.service.close()
-        self.mock_db.close.assert_called_once()
-
-    def test_convert_report_transactions_to_database_transactions(self):
-        """Test converting ReportTransaction objects to database-compatible dictionaries."""
-        # Arrange
-        report_transactions = [self.report_transaction]
-
-        # Act
-        result = self.service._convert_report_transactions_to_database_transactions(report_transactions)
-
-        # Assert
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0]["vendor"], "Test Vendor")
-        self.assertEqual(result[0]["amount"], -100.0)
-        self.assertEqual(result[0]["date"], "2025-03-01")
-        self.assertEqual(result[0]["description"], "Test transaction")
-        self.assertEqual(result[0]["source"], Source.BANK_OF_AMERICA)
-
-    def test_insert_transactions(self):
-        """Test inserting transactions into the database."""
-        # Arrange
-        report_transactions = [self.report_transaction]
-        self.mock_category_repo.get_all_subcategories.return_value = [self.test_category]
-        self.mock_categorizer.categorize.return_value = self.test_category
-        self.mock_embedder.embed_transaction.return_value = self.test_embedding
-        self.mock_transaction_repo.create_transaction.return_value = self.db_transaction
-
-        # Act
-        result = self.service.insert_transactions(report_transactions)
-
-        # Assert
-        self.assertEqual(result, 1)
-        self.mock_category_repo.get_all_subcategories.assert_called_once()
-        self.mock_categorizer.categorize.assert_called_once()
-        self.mock_embedder.embed_transaction.assert_called()
-        self.mock_transaction_repo.create_transaction.assert_called_once()
-
-    def test_insert_transactions_no_category_match(self):
-        """Test inserting transactions that don't match a category."""
-        # Arrange
-        report_transactions = [self.report_transaction]
-        self.mock_category_repo.get_all_subcategories.return_value = [self.test_category]
-        self.mock_categorizer.categorize.return_value = None  # No category match
-        self.mock_embedder.embed_transaction.return_value = self.test_embedding
-        self.mock_transaction_repo.create_transaction.return_value = self.db_transaction
-
-        # Act
-        result = self.service.insert_transactions(report_transactions)
-
-        # Assert
-        self.assertEqual(result, 1)
-        self.mock_category_repo.get_all_subcategories.assert_called_once()
-        self.mock_categorizer.categorize.assert_called_once()
-        self.mock_embedder.embed_transaction.assert_called()
-        self.mock_transaction_repo.create_transaction.assert_called_once()
 
-        # Verify the transaction was created without a category_id
-        called_transaction = self.mock_transaction_repo.create_transaction.call_args[0][0]
-        self.assertNotIn("category_id", called_transaction)
-
-    def test_insert_transactions_creation_failure(self):
-        """Test handling transaction creation failures."""
-        # Arrange
-        report_transactions = [self.report_transaction]
-        self.mock_category_repo.get_all_subcategories.return_value = [self.test_category]
-        self.mock_categorizer.categorize.return_value = self.test_category
-        self.mock_embedder.embed_transaction.return_value = self.test_embedding
-        self.mock_transaction_repo.create_transaction.return_value = None  # Creation failed
-
-        # Act
-        result = self.service.insert_transactions(report_transactions)
-
-        # Assert
-        self.assertEqual(result, 0)  # No transactions created successfully
-
-    def test_get_transactions_by_date_range(self):
-        """Test retrieving transactions by date range."""
-        # Arrange
-        start_date = datetime(2025, 1, 1)
-        end_date = datetime(2025, 3, 31)
-        expected_transactions = [self.db_transaction]
-        self.mock_transaction_category_repo.get_transactions_by_date_range.return_value = expected_transactions
-
-        # Act
-        result = self.service.get_transactions_by_date_range(start_date, end_date)
-
-        # Assert
-        self.mock_transaction_category_repo.get_transactions_by_date_range.assert_called_once_with(start_date, end_date)
-        self.assertEqual(result, expected_transactions)
-
-    def test_get_all_transactions(self):
-        """Test retrieving all transactions."""
-        # Arrange
-        expected_transactions = [self.report_transaction]
-        self.mock_transaction_category_repo.get_transactions.return_value = expected_transactions
-
-        # Act
-        result = self.service.get_all_transactions()
-
-        # Assert
-        self.mock_transaction_category_repo.get_transactions.assert_called_once()
-        self.assertEqual(result, expected_transactions)
-
-    def test_get_transactions_without_category(self):
-        """Test retrieving transactions without a category."""
-        # Arrange
-        expected_transactions = [self.db_transaction]
-        self.mock_transaction_repo.get_transactions_without_category.return_value = expected_transactions
-
-        # Act
-        result = self.service.get_transactions_without_category()
-
-        # Assert
-        self.mock_transaction_repo.get_transactions_without_category.assert_called_once()
-        self.assertEqual(result, expected_transactions)
-
-    def test_get_transactions_with_category(self):
-        """Test retrieving transactions with a category."""
-        # Arrange
-        expected_transactions = [self.db_transaction]
-        self.mock_transaction_category_repo.get_transactions_with_category.return_value = expected_transactions
-
-        # Act
-        result = self.service.get_transactions_with_category()
-
-        # Assert
-        self.mock_transaction_category_repo.get_transactions_with_category.assert_called_once()
-        self.assertEqual(result, expected_transactions)
-
-    def test_embed_transactions(self):
-        """Test embedding transactions."""
-        # Arrange
-        transactions = [self.db_transaction]
-        embeddings = [self.test_embedding]
-        self.mock_transaction_category_repo.get_transactions_with_category.return_value = transactions
-        self.mock_embedder.embed_transactions.return_value = embeddings
-
-        # Act
-        self.service.embed_transactions()
-
-        # Assert
-        self.mock_transaction_category_repo.get_transactions_with_category.assert_called_once()
-        self.mock_embedder.embed_transactions.assert_called_once_with(transactions)
-        self.mock_transaction_repo.update_transaction.assert_called_once()
-
-        # Verify transaction was updated with embedding
-        self.assertEqual(self.db_transaction.embedding, self.test_embedding)
-
-    def test_find_similar_transactions_with_existing_embedding(self):
-        """Test finding similar transactions when transaction has an embedding."""
-        # Arrange
-        transaction = self.db_transaction
-        transaction.embedding = self.test_embedding
-        expected_similar = [MagicMock(spec=Transaction) for _ in range(5)]
-        self.mock_transaction_category_repo.find_similar_transactions.return_value = expected_similar
-
-        # Act
-        result = self.service.find_similar_transactions(transaction)
-
-        # Assert
-        self.mock_transaction_category_repo.find_similar_transactions.assert_called_once_with(self.test_embedding, 5)
-        self.mock_embedder.embed_transaction.assert_not_called()  # Shouldn't be called if embedding exists
-        self.assertEqual(result, expected_similar)
-
-    def test_find_similar_transactions_without_embedding(self):
-        """Test finding similar transactions when transaction has no embedding."""
-        # Arrange
-        transaction = self.db_transaction
-        transaction.embedding = None
-        expected_similar = [MagicMock(spec=Transaction) for _ in range(5)]
-        self.mock_embedder.embed_transaction.return_value = self.test_embedding
-        self.mock_transaction_category_repo.find_similar_transactions.return_value = expected_similar
-
-        # Act
-        result = self.service.find_similar_transactions(transaction)
-
-        # Assert
-        self.mock_embedder.embed_transaction.assert_called_once_with(transaction)
-        self.mock_transaction_category_repo.find_similar_transactions.assert_called_once_with(self.test_embedding, 5)
-        self.assertEqual(result, expected_similar)
-
-    def test_update_transactions_category(self):
-        """Test updating transaction categories."""
-        # Arrange
-        transactions = [self.db_transaction]
-        self.mock_category_repo.get_all_subcategories.return_value = [self.test_category]
-        self.mock_categorizer.categorize.return_value = self.test_category
-        self.mock_embedder.embed_transaction.return_value = self.test_embedding
-
-        # Act
-        self.service.update_transactions_category(transactions)
-
-        # Assert
-        self.mock_category_repo.get_all_subcategories.assert_called_once()
-        self.mock_categorizer.categorize.assert_called_once()
-        self.mock_embedder.embed_transaction.assert_called()
-        self.mock_transaction_repo.update_transaction.assert_called_once_with(self.db_transaction)
-
-        # Verify transaction was updated
-        self.assertEqual(self.db_transaction.category, self.test_category)
-        self.assertEqual(self.db_transaction.embedding, self.test_embedding)
-
-    def test_get_category_for_transaction(self):
-        """Test getting a category for a transaction."""
-        # Arrange
-        transaction = self.db_transaction
-        sub_categories = [self.test_category]
-        similar_transactions = [MagicMock(spec=Transaction) for _ in range(10)]
-
-        self.mock_embedder.embed_transaction.return_value = self.test_embedding
-        self.mock_transaction_category_repo.find_similar_transactions.return_value = similar_transactions
-        self.mock_categorizer.categorize.return_value = self.test_category
-
-        # Act
-        result = self.service._get_category_for_transaction(transaction, sub_categories)
-
-        # Assert
-        self.mock_embedder.embed_transaction.assert_called_once_with(transaction)
-        self.mock_transaction_category_repo.find_similar_transactions.assert_called_once_with(self.test_embedding, 10)
-        self.mock_categorizer.categorize.assert_called_once_with(transaction, similar_transactions, sub_categories)
-        self.assertEqual(result, self.test_category)
-
-
-if __name__ == "__main__":
-    unittest.main()
+def test_get_transactions_by_date_range(ctx, db_transaction):
+    """Test retrieving transactions by date range."""
+    # Arrange
+    start_date = datetime(2025, 1, 1)
+    end_date = datetime(2025, 3, 31)
+    expected_transactions = [db_transaction]
+    ctx.transaction_category_repo.get_transactions_by_date_range.return_value = expected_transactions
+
+    # Act
+    result = ctx.service.get_transactions_by_date_range(start_date, end_date)
+
+    # Assert
+    ctx.transaction_category_repo.get_transactions_by_date_range.assert_called_once_with(
+        start_date, end_date, require_category=False
+    )
+    assert result == expected_transactions
+
+
+def test_get_all_transactions(ctx, report_transaction):
+    """Test retrieving all transactions."""
+    # Arrange
+    expected_transactions = [report_transaction]
+    ctx.transaction_category_repo.get_transactions.return_value = expected_transactions
+
+    # Act
+    result = ctx.service.get_all_transactions()
+
+    # Assert
+    ctx.transaction_category_repo.get_transactions.assert_called_once()
+    assert result == expected_transactions
+
+
+def test_get_transactions_without_category(ctx, db_transaction):
+    """Test retrieving transactions without a category."""
+    # Arrange
+    expected_transactions = [db_transaction]
+    ctx.transaction_repo.get_transactions_without_category.return_value = expected_transactions
+
+    # Act
+    result = ctx.service.get_transactions_without_category()
+
+    # Assert
+    ctx.transaction_repo.get_transactions_without_category.assert_called_once()
+    assert result == expected_transactions
+
+
+def test_get_transactions_with_category(ctx, db_transaction):
+    """Test retrieving transactions with a category."""
+    # Arrange
+    expected_transactions = [db_transaction]
+    ctx.transaction_category_repo.get_transactions_with_category.return_value = expected_transactions
+
+    # Act
+    result = ctx.service.get_transactions_with_category()
+
+    # Assert
+    ctx.transaction_category_repo.get_transactions_with_category.assert_called_once()
+    assert result == expected_transactions
+
+
+def test_embed_transactions(ctx, db_transaction):
+    """Test embedding transactions."""
+    # Arrange
+    transactions = [db_transaction]
+    embeddings = [_TEST_EMBEDDING]
+    ctx.transaction_category_repo.get_transactions_with_category.return_value = transactions
+    ctx.embedder.embed_transactions.return_value = embeddings
+
+    # Act
+    ctx.service.embed_transactions()
+
+    # Assert
+    ctx.transaction_category_repo.get_transactions_with_category.assert_called_once()
+    ctx.embedder.embed_transactions.assert_called_once_with(transactions)
+    ctx.transaction_repo.update_transaction.assert_called_once()
+
+    # Verify transaction was updated with embedding
+    assert db_transaction.embedding == _TEST_EMBEDDING
+
+
+def _warm_similarity_cache(ctx):
+    """Warm the module-level similarity cache through one service lookup."""
+    ctx.transaction_category_repo.get_transactions_with_category.return_value = [
+        SimpleNamespace(id=1, embedding=[1.0, 0.0])
+    ]
+    ctx.service.find_similar_transactions(SimpleNamespace(embedding=[1.0, 0.0]), limit=1)
+    assert expense_service_module._similarity_cache.is_warm
+
+
+def test_find_similar_transactions_uses_warm_cache(ctx):
+    """Test that the lazily built cache serves repeat similarity lookups."""
+    # Arrange: three embedded transactions with a known similarity ordering
+    tx_a = SimpleNamespace(id=1, embedding=[1.0, 0.0])
+    tx_b = SimpleNamespace(id=2, embedding=[0.8, 0.6])
+    tx_c = SimpleNamespace(id=3, embedding=[0.0, 1.0])
+    ctx.transaction_category_repo.get_transactions_with_category.return_value = [tx_a, tx_b, tx_c]
+    query = SimpleNamespace(embedding=[1.0, 0.0])
+
+    # Act: the first call builds the cache, the second reuses it
+    result = ctx.service.find_similar_transactions(query, limit=2)
+    repeat = ctx.service.find_similar_transactions(query, limit=2)
+
+    # Assert: scored in memory, most similar first, one warm-up fetch total
+    assert result == [tx_a, tx_b]
+    assert repeat == [tx_a, tx_b]
+    ctx.transaction_category_repo.find_similar_transactions.assert_not_called()
+    ctx.transaction_category_repo.get_transactions_with_category.assert_called_once()
+
+
+def test_insert_transactions_invalidates_similarity_cache(ctx, report_transaction, test_category, db_transaction):
+    """Test that a successful insert drops the warm similarity cache."""
+    # Arrange
+    _warm_similarity_cache(ctx)
+    ctx.category_repo.get_all_subcategories.return_value = [test_category]
+    ctx.categorizer.categorize.return_value = test_category
+    ctx.embedder.embed_transaction.return_value = _TEST_EMBEDDING
+    ctx.transaction_repo.create_transaction.return_value = db_transaction
+
+    # Act
+    ctx.service.insert_transactions([report_transaction])
+
+    # Assert
+    assert not expense_service_module._similarity_cache.is_warm
+
+
+def test_update_transactions_category_invalidates_similarity_cache(ctx):
+    """Test that updating categories drops the warm similarity cache."""
+    # Arrange
+    _warm_similarity_cache(ctx)
+
+    # Act
+    ctx.service.update_transactions_category([])
+
+    # Assert
+    assert not expense_service_module._similarity_cache.is_warm
+
+
+def test_find_similar_transactions_with_existing_embedding(ctx, db_transaction):
+    """Test finding similar transactions when transaction has an embedding."""
+    # Arrange
+    db_transaction.embedding = _TEST_EMBEDDING
+    expected_similar = list(_SIMILAR_TX_POOL[:5])
+    ctx.transaction_category_repo.find_similar_transactions.return_value = expected_similar
+
+    # Act
+    result = ctx.service.find_similar_transactions(db_transaction)
+
+    # Assert
+    ctx.transaction_category_repo.find_similar_transactions.assert_called_once_with(_TEST_EMBEDDING, 5)
+    ctx.embedder.embed_transaction.assert_not_called()  # Shouldn't be called if embedding exists
+    assert result == expected_similar
+
+
+def test_find_similar_transactions_without_embedding(ctx, db_transaction):
+    """Test finding similar transactions when transaction has no embedding."""
+    # Arrange
+    db_transaction.embedding = None
+    expected_similar = list(_SIMILAR_TX_POOL[:5])
+    ctx.embedder.embed_transaction.return_value = _TEST_EMBEDDING
+    ctx.transaction_category_repo.find_similar_transactions.return_value = expected_similar
+
+    # Act
+    result = ctx.service.find_similar_transactions(db_transaction)
+
+    # Assert
+    ctx.embedder.embed_transaction.assert_called_once_with(db_transaction)
+    ctx.transaction_category_repo.find_similar_transactions.assert_called_once_with(_TEST_EMBEDDING, 5)
+    assert result == expected_similar
+
+
+def test_update_transactions_category(ctx, db_transaction, test_category):
+    """Test updating transaction categories."""
+    # Arrange
+    ctx.category_repo.get_all_subcategories.return_value = [test_category]
+    ctx.categorizer.categorize.return_value = test_category
+    ctx.embedder.embed_transaction.return_value = _TEST_EMBEDDING
+
+    # Act
+    ctx.service.update_transactions_category([db_transaction])
+
+    # Assert
+    ctx.category_repo.get_all_subcategories.assert_called_once()
+    ctx.categorizer.categorize.assert_called_once()
+    ctx.embedder.embed_transaction.assert_called()
+    ctx.transaction_repo.update_transaction.assert_called_once_with(db_transaction)
+
+    # Verify transaction was updated
+    assert db_transaction.category == test_category
+    assert db_transaction.embedding == _TEST_EMBEDDING
+
+
+def test_get_category_for_transaction(ctx, db_transaction, test_category):
+    """Test getting a category for a transaction."""
+    # Arrange
+    sub_categories = [test_category]
+    similar_transactions = list(_SIMILAR_TX_POOL)
+
+    ctx.embedder.embed_transaction.return_value = _TEST_EMBEDDING
+    ctx.transaction_category_repo.find_similar_transactions.return_value = similar_transactions
+    ctx.categorizer.categorize.return_value = test_category
+
+    # Act
+    result = ctx.service._get_category_for_transaction(db_transaction, sub_categories)
+
+    # Assert
+    ctx.embedder.embed_transaction.assert_called_once_with(db_transaction)
+    ctx.transaction_category_repo.find_similar_transactions.assert_called_once_with(_TEST_EMBEDDING, 10)
+    ctx.categorizer.categorize.assert_called_once_with(db_transaction, similar_transactions, sub_categories)
+    assert result == test_category
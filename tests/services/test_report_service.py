@@ -1,248 +1,198 @@
 """Unit tests for the ReportService class."""
 
-import unittest
-from datetime import date, datetime
-from unittest.mock import MagicMock, patch
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
-from expense_analyzer.database.models import Category, Transaction, VendorSummary
+import pytest
+
+import expense_analyzer.services.report_service as report_service_module
 from expense_analyzer.models.reports import (
     AverageMonthSummary,
-    CategorySummary,
     OverviewSummary,
     ReportData,
     ReportDataItem,
 )
 from expense_analyzer.services.report_service import ReportService
 
+# Collaborators replaced on the service module, in constructor order;
+# get_db is stubbed for the whole session in conftest
+_PATCH_TARGETS = (
+    ("transaction_category_repo", "TransactionCategoryRepository"),
+    ("category_repo", "CategoryRepository"),
+)
+
+_TEST_YEAR = 2023
+
+
+@pytest.fixture(scope="module")
+def _module_ctx():
+    """ReportService built once per module against directly-assigned mocks.
+
+    The function-scoped monkeypatch fixture cannot back a module-scoped
+    fixture, so a MonkeyPatch instance is managed by hand and undone on
+    teardown."""
+    monkeypatch = pytest.MonkeyPatch()
+    mocks = SimpleNamespace()
+    for name, attr in _PATCH_TARGETS:
+        mock = MagicMock()
+        setattr(mocks, name, mock)
+        monkeypatch.setattr(report_service_module, attr, MagicMock(return_value=mock))
+    mocks.service = ReportService()
+    yield mocks
+    monkeypatch.undo()
+
+
+@pytest.fixture
+def ctx(_module_ctx, service_db):
+    """The shared service context with every mock reset for the current test.
+
+    reset_mock only clears call tracking and configured returns, which is
+    far cheaper than rebuilding the service and its mocks per test."""
+    _module_ctx.db = service_db
+    for name, _ in _PATCH_TARGETS:
+        getattr(_module_ctx, name).reset_mock(return_value=True, side_effect=True)
+    return _module_ctx
+
+
+def _report_data_item(item_date, amount, category, sub_category, vendor="Test Restaurant"):
+    """Build a ReportDataItem with the shared category pair."""
+    return ReportDataItem(date=item_date, amount=amount, category=category, sub_category=sub_category, vendor=vendor)
+
 
-class TestReportService(unittest.TestCase):
-    """Test cases for the ReportService class."""
-
-    @patch("expense_analyzer.services.report_service.get_db")
-    @patch("expense_analyzer.services.report_service.TransactionCategoryRepository")
-    @patch("expense_analyzer.services.report_service.CategoryRepository")
-    def setUp(
-        self,
-        mock_category_repo_class,
-        mock_transaction_category_repo_class,
-        mock_get_db,
-    ):
-        """Set up test fixtures before each test method."""
-        # Setup mocks
-        self.mock_db = MagicMock()
-        mock_get_db.return_value = self.mock_db
-
-        self.mock_transaction_category_repo = MagicMock()
-        mock_transaction_category_repo_class.return_value = self.mock_transaction_category_repo
-
-        self.mock_category_repo = MagicMock()
-        mock_category_repo_class.return_value = self.mock_category_repo
-
-        # Initialize service
-        self.service = ReportService()
-
-        # Common test data
-        self.test_year = 2023
-        
-        # Create test categories
-        self.parent_category = Category(id=1, name="Food", parent_id=None)
-        self.sub_category = Category(id=2, name="Dining", parent_id=1)
-        self.test_categories = [self.parent_category, self.sub_category]
-
-        # Create test transactions
-        self.test_transaction = Transaction(
-            id=1,
-            vendor="Test Restaurant",
-            amount=-50.0,
-            date=date(2023, 3, 15),
-            description="Dinner",
-            category_id=2  # Sub-category ID
-        )
-        
-        # Create test vendor summaries
-        self.test_vendor_summaries = [
-            VendorSummary(vendor="Test Restaurant", total_amount=150.0, count=3),
-            VendorSummary(vendor="Grocery Store", total_amount=120.0, count=2),
-        ]
-
-    def test_init(self):
-        """Test service initialization."""
-        self.assertIsNotNone(self.service)
-        self.assertEqual(self.service.db, self.mock_db)
-        self.assertEqual(self.service.repository, self.mock_transaction_category_repo)
-        self.assertEqual(self.service.category_repository, self.mock_category_repo)
-
-    def test_map_transaction_to_report_data_item(self):
-        """Test mapping a transaction to a ReportDataItem."""
-        # Act
-        result = self.service._map_transaction_to_report_data_item(self.test_transaction, self.test_categories)
-        
-        # Assert
-        self.assertIsInstance(result, ReportDataItem)
-        self.assertEqual(result.date, self.test_transaction.date)
-        self.assertEqual(result.amount, self.test_transaction.amount)
-        self.assertEqual(result.category, self.parent_category)
-        self.assertEqual(result.sub_category, self.sub_category)
-        self.assertEqual(result.vendor, self.test_transaction.vendor)
-
-    def test_get_total_expenses(self):
-        """Test getting total expenses from transactions."""
-        # Arrange
-        transactions = [
-            ReportDataItem(
-                date=date(2023, 3, 15),
-                amount=-50.0,
-                category=self.parent_category,
-                sub_category=self.sub_category,
-                vendor="Test Restaurant"
-            ),
-            ReportDataItem(
-                date=date(2023, 3, 16),
-                amount=-30.0,
-                category=self.parent_category,
-                sub_category=self.sub_category,
-                vendor="Test Restaurant"
-            ),
-            ReportDataItem(
-                date=date(2023, 3, 17),
-                amount=10.0,  # Positive amount, should be ignored
-                category=self.parent_category,
-                sub_category=self.sub_category,
-                vendor="Refund"
-            )
-        ]
-        
-        # Act
-        result = self.service._get_total_expenses(transactions)
-        
-        # Assert
-        self.assertEqual(result, 80.0)  # 50 + 30
-
-    def test_get_top_vendors(self):
-        """Test getting top vendors by expense amount."""
-        # Arrange
-        self.mock_transaction_category_repo.get_top_vendors.return_value = self.test_vendor_summaries
-        
-        # Act
-        result = self.service._get_top_vendors(self.test_year)
-        
-        # Assert
-        self.assertEqual(result, self.test_vendor_summaries)
-        self.mock_transaction_category_repo.get_top_vendors.assert_called_once_with(self.test_year, limit=10)
-
-    def test_get_highest_spending_month(self):
-        """Test getting the highest spending month."""
-        # Arrange - Create mock summary objects that return the desired total_expenses
-        january_summary = MagicMock(spec=OverviewSummary)
-        january_summary.total_expenses = 100.0
-        
-        february_summary = MagicMock(spec=OverviewSummary)
-        february_summary.total_expenses = 150.0
-        
-        march_summary = MagicMock(spec=OverviewSummary)
-        march_summary.total_expenses = 80.0
-        
-        per_month_data = {
-            "January": january_summary,
-            "February": february_summary,
-            "March": march_summary,
-        }
-        
-        # Act
-        month, summary = self.service._get_highest_spending_month(per_month_data)
-        
-        # Assert
-        self.assertEqual(month, "February")
-        self.assertEqual(summary.total_expenses, 150.0)
-
-    def test_get_highest_spending_vendor(self):
-        """Test getting the highest spending vendor."""
-        # Act
-        result = self.service._get_highest_spending_vendor(self.test_vendor_summaries)
-        
-        # Assert
-        self.assertEqual(result.vendor, "Test Restaurant")
-        self.assertEqual(result.total_amount, 150.0)
-
-    def test_generate_report_data(self):
-        """Test generating report data."""
-        # Arrange
-        self.mock_category_repo.get_all_categories.return_value = self.test_categories
-        self.mock_transaction_category_repo.get_transactions_by_year.return_value = [self.test_transaction]
-        self.mock_transaction_category_repo.get_top_vendors.return_value = self.test_vendor_summaries
-        self.mock_transaction_category_repo.get_top_expenses.return_value = [self.test_transaction]
-        
-        # Act
-        result = self.service.generate_report_data(self.test_year)
-        
-        # Assert
-        self.assertIsInstance(result, ReportData)
-        self.assertEqual(result.year, self.test_year)
-        self.assertIsInstance(result.per_month_data, dict)
-        self.assertIsInstance(result.per_year_data, OverviewSummary)
-        self.assertIsInstance(result.average_month, AverageMonthSummary)
-        self.assertEqual(len(result.top_vendors), len(self.test_vendor_summaries))
-        self.assertEqual(result.total_transactions, 1)
-
-    def test_get_per_month_data_for_year(self):
-        """Test getting per month data for a year."""
-        # Arrange
-        transactions = [
-            ReportDataItem(
-                date=date(2023, 1, 15),
-                amount=-50.0,
-                category=self.parent_category,
-                sub_category=self.sub_category,
-                vendor="Test Restaurant"
-            ),
-            ReportDataItem(
-                date=date(2023, 3, 16),
-                amount=-30.0,
-                category=self.parent_category,
-                sub_category=self.sub_category,
-                vendor="Test Restaurant"
-            )
-        ]
-        
-        # Act
-        result = self.service._get_per_month_data_for_year(transactions)
-        
-        # Assert
-        self.assertIn("January", result)
-        self.assertIn("March", result)
-        self.assertEqual(len(result), 2)  # Should have data for two months
-        self.assertIsInstance(result["January"], OverviewSummary)
-        self.assertIsInstance(result["March"], OverviewSummary)
-
-    def test_get_average_month(self):
-        """Test getting average month summary."""
-        # Arrange
-        transactions = [
-            ReportDataItem(
-                date=date(2023, 1, 15),
-                amount=-50.0,
-                category=self.parent_category,
-                sub_category=self.sub_category,
-                vendor="Test Restaurant"
-            ),
-            ReportDataItem(
-                date=date(2023, 2, 16),
-                amount=-30.0,
-                category=self.parent_category,
-                sub_category=self.sub_category,
-                vendor="Test Restaurant"
-            )
-        ]
-        
-        # Act
-        result = self.service._get_average_month(transactions)
-        
-        # Assert
-        self.assertIsInstance(result, AverageMonthSummary)
-        # Since we have transactions across 2 months and total expenses of 80,
-        # the average should be 40
-        self.assertEqual(result.estimated_total_expenses, -40.0)
-
-
-if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+def test_init(ctx):
+    """Test service initialization."""
+    assert ctx.service is not None
+    assert ctx.service.db == ctx.db
+    assert ctx.service.repository == ctx.transaction_category_repo
+    assert ctx.service.category_repository == ctx.category_repo
+
+
+def test_map_transaction_to_report_data_item(ctx, test_transaction, test_categories, parent_category, sub_category):
+    """Test mapping a transaction to a ReportDataItem."""
+    # Act
+    result = ctx.service._map_transaction_to_report_data_item(test_transaction, test_categories)
+
+    # Assert
+    assert isinstance(result, ReportDataItem)
+    assert result.date == test_transaction.date
+    assert result.amount == test_transaction.amount
+    assert result.category == parent_category
+    assert result.sub_category == sub_category
+    assert result.vendor == test_transaction.vendor
+
+
+def test_get_total_expenses(ctx, parent_category, sub_category):
+    """Test getting total expenses from transactions."""
+    # Arrange
+    transactions = [
+        _report_data_item(date(2023, 3, 15), -50.0, parent_category, sub_category),
+        _report_data_item(date(2023, 3, 16), -30.0, parent_category, sub_category),
+        # Positive amount, should be ignored
+        _report_data_item(date(2023, 3, 17), 10.0, parent_category, sub_category, vendor="Refund"),
+    ]
+
+    # Act
+    result = ctx.service._get_total_expenses(transactions)
+
+    # Assert
+    assert result == 80.0  # 50 + 30
+
+
+def test_get_top_vendors(ctx, test_vendor_summaries):
+    """Test getting top vendors by expense amount."""
+    # Arrange
+    ctx.transaction_category_repo.get_top_vendors.return_value = test_vendor_summaries
+
+    # Act
+    result = ctx.service._get_top_vendors(_TEST_YEAR)
+
+    # Assert
+    assert result == test_vendor_summaries
+    ctx.transaction_category_repo.get_top_vendors.assert_called_once_with(_TEST_YEAR, limit=10)
+
+
+def test_get_highest_spending_month(ctx):
+    """Test getting the highest spending month."""
+    # Arrange - the helper only reads total_expenses, so a SimpleNamespace
+    # is a much cheaper summary stand-in than a spec'd mock
+    per_month_data = {
+        "January": SimpleNamespace(total_expenses=100.0),
+        "February": SimpleNamespace(total_expenses=150.0),
+        "March": SimpleNamespace(total_expenses=80.0),
+    }
+
+    # Act
+    month, summary = ctx.service._get_highest_spending_month(per_month_data)
+
+    # Assert
+    assert month == "February"
+    assert summary.total_expenses == 150.0
+
+
+def test_get_highest_spending_vendor(ctx, test_vendor_summaries):
+    """Test getting the highest spending vendor."""
+    # Act
+    result = ctx.service._get_highest_spending_vendor(test_vendor_summaries)
+
+    # Assert
+    assert result.vendor == "Test Restaurant"
+    assert result.total_amount == 150.0
+
+
+def test_generate_report_data(ctx, test_categories, test_transaction, test_vendor_summaries):
+    """Test generating report data."""
+    # Arrange
+    ctx.category_repo.get_all_categories.return_value = test_categories
+    ctx.transaction_category_repo.get_transactions_by_year.return_value = [test_transaction]
+    ctx.transaction_category_repo.get_top_vendors.return_value = test_vendor_summaries
+    ctx.transaction_category_repo.get_top_expenses.return_value = [test_transaction]
+
+    # Act
+    result = ctx.service.generate_report_data(_TEST_YEAR)
+
+    # Assert
+    assert isinstance(result, ReportData)
+    assert result.year == _TEST_YEAR
+    assert isinstance(result.per_month_data, dict)
+    assert isinstance(result.per_year_data, OverviewSummary)
+    assert isinstance(result.average_month, AverageMonthSummary)
+    assert len(result.top_vendors) == len(test_vendor_summaries)
+    assert result.total_transactions == 1
+
+
+def test_get_per_month_data_for_year(ctx, parent_category, sub_category):
+    """Test getting per month data for a year."""
+    # Arrange
+    transactions = [
+        _report_data_item(date(2023, 1, 15), -50.0, parent_category, sub_category),
+        _report_data_item(date(2023, 3, 16), -30.0, parent_category, sub_category),
+    ]
+
+    # Act
+    result = ctx.service._get_per_month_data_for_year(transactions)
+
+    # Assert
+    assert "January" in result
+    assert "March" in result
+    assert len(result) == 2  # Should have data for two months
+    assert isinstance(result["January"], OverviewSummary)
+    assert isinstance(result["March"], OverviewSummary)
+
+
+def test_get_average_month(ctx, parent_category, sub_category):
+    """Test getting average month summary."""
+    # Arrange
+    transactions = [
+        _report_data_item(date(2023, 1, 15), -50.0, parent_category, sub_category),
+        _report_data_item(date(2023, 2, 16), -30.0, parent_category, sub_category),
+    ]
+
+    # Act
+    result = ctx.service._get_average_month(transactions)
+
+    # Assert
+    assert isinstance(result, AverageMonthSummary)
+    # Since we have transactions across 2 months and total expenses of 80,
+    # the average should be 40
+    assert result.estimated_total_expenses == -40.0